@@ -0,0 +1,217 @@
+"""
+ALT (A*, Landmarks, Triangle inequality) point-to-point shortest paths.
+
+Preprocessing picks k landmarks by farthest-point selection and stores the
+distances from (and, on directed graphs, to) every landmark as flat arrays. A
+query is an A* search whose potential is the best triangle-inequality lower
+bound over the landmarks, using any heap from heaps/.
+
+The tables can be saved next to a test_graphs json file as <graph>.alt.npz so
+they are only computed once per graph.
+"""
+
+import os
+from array import array
+
+import numpy as np
+
+from csr import CSRGraph, SearchState, json_fingerprint
+from main import get_heap, dijkstra_search
+
+
+class Landmarks(object):
+    """Landmark ids plus their distance tables over one graph"""
+
+    def __init__(
+        self,
+        landmarks,
+        forward,
+        backward,
+        num_nodes,
+        num_edges,
+        fingerprint=None,
+        k=None,
+    ):
+        """forward[i][v] = d(landmarks[i], v), backward[i][v] = d(v, landmarks[i])
+
+        fingerprint is the json_fingerprint of the graph json file the tables
+        were built from, if any. k is the number of landmarks asked for, which
+        is more than len(landmarks) when build ran out of reachable nodes.
+        """
+        self.k = len(landmarks) if k is None else k
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.num_nodes = num_nodes
+        self.num_edges = num_edges
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, G, k=8, heap_choice="MinHeap", start=None):
+        """Pick k landmarks by farthest-point selection and compute their tables
+
+        The first landmark is the node farthest from start (default the first
+        node), each following one the node farthest from all landmarks so far.
+        """
+        C = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+        n = C.num_nodes
+        requested, k = k, min(k, n)
+        reverse = C.reverse()
+        state = SearchState.for_graph(C)
+
+        def distances(graph, source):
+            dijkstra_search(graph, [source], get_heap(heap_choice), state=state)
+            return array("d", (state.distance(v) for v in range(n)))
+
+        # Distance from each node to its nearest landmark so far
+        nearest = distances(C, 0 if start is None else C.node_id(start))
+
+        landmarks, forward, backward = [], [], []
+        for _ in range(k):
+            reachable = [v for v in range(n) if nearest[v] != float("inf")]
+            candidate = max(reachable, key=nearest.__getitem__)
+            if nearest[candidate] == 0 and landmarks:
+                # Every reachable node is already a landmark
+                break
+
+            landmarks.append(candidate)
+            forward.append(distances(C, candidate))
+            if C.directed:
+                backward.append(distances(reverse, candidate))
+            else:
+                backward.append(forward[-1])
+
+            if len(landmarks) == 1:
+                nearest = array("d", forward[0])
+            else:
+                nearest = array("d", map(min, nearest, forward[-1]))
+
+        return cls(landmarks, forward, backward, n, C.number_of_edges(), k=requested)
+
+    def save(self, path):
+        """Write the tables as an npz archive"""
+        tables = {
+            "landmarks": np.asarray(self.landmarks, dtype=np.int64),
+            "forward": np.asarray(self.forward, dtype=np.float64),
+            "shape": np.asarray([self.num_nodes, self.num_edges], dtype=np.int64),
+            "k": np.asarray(self.k, dtype=np.int64),
+        }
+        if self.fingerprint is not None:
+            tables["fingerprint"] = np.asarray(self.fingerprint, dtype=np.int64)
+        # Undirected graphs share one table per landmark
+        if any(b is not f for f, b in zip(self.forward, self.backward)):
+            tables["backward"] = np.asarray(self.backward, dtype=np.float64)
+        with open(path, "wb") as f:
+            np.savez(f, **tables)
+
+    @classmethod
+    def load(cls, path):
+        """Read tables written by save"""
+        with np.load(path) as tables:
+            landmarks = tables["landmarks"].tolist()
+            forward = [array("d", row.tobytes()) for row in tables["forward"]]
+            if "backward" in tables:
+                backward = [array("d", row.tobytes()) for row in tables["backward"]]
+            else:
+                backward = forward
+            num_nodes, num_edges = tables["shape"].tolist()
+            fingerprint = None
+            if "fingerprint" in tables:
+                fingerprint = tables["fingerprint"].tolist()
+            k = int(tables["k"]) if "k" in tables else None
+        return cls(landmarks, forward, backward, num_nodes, num_edges, fingerprint, k)
+
+    def potential(self, v, t):
+        """Lower bound on d(v, t) from the triangle inequality"""
+        best = 0
+        for fwd, bwd in zip(self.forward, self.backward):
+            # d(L, t) <= d(L, v) + d(v, t) and d(v, L) <= d(v, t) + d(t, L);
+            # inf - inf is nan, which never compares greater than best.
+            bound = fwd[t] - fwd[v]
+            if bound > best:
+                best = bound
+            bound = bwd[v] - bwd[t]
+            if bound > best:
+                best = bound
+        return best
+
+    def __len__(self):
+        return len(self.landmarks)
+
+
+def landmarks_file(graph_file):
+    """Path of the landmark tables stored next to a graph json file"""
+    root, _ = os.path.splitext(graph_file)
+    return f"{root}.alt.npz"
+
+
+def load_or_build(graph_file, k=8, heap_choice="MinHeap"):
+    """Load a graph json file and its landmark tables, building them if needed
+
+    Returns (CSRGraph, Landmarks). Tables that were built from a different
+    version of the json file (by json_fingerprint), for a different graph or a
+    different k are rebuilt and overwritten.
+    """
+    C = CSRGraph.from_json(graph_file)
+    path = landmarks_file(graph_file)
+    fingerprint = json_fingerprint(graph_file)
+
+    if os.path.exists(path):
+        landmarks = Landmarks.load(path)
+        if (
+            landmarks.fingerprint == fingerprint
+            and landmarks.k == k
+            and landmarks.num_nodes == C.num_nodes
+            and landmarks.num_edges == C.number_of_edges()
+        ):
+            return C, landmarks
+
+    landmarks = Landmarks.build(C, k, heap_choice)
+    landmarks.fingerprint = fingerprint
+    landmarks.save(path)
+    return C, landmarks
+
+
+def alt_path_heaps(C, source, target, heap, landmarks, state=None):
+    """A* search on a CSRGraph guided by landmark lower bounds
+
+    Heap keys are distance plus potential; because the potential is consistent
+    the search can stop as soon as target is extracted, like lazy Dijkstra.
+    An infinite potential proves a node cannot reach target (on directed
+    graphs), so such nodes are never put in the heap.
+    """
+    offsets, targets, weights = C.offsets, C.targets, C.weights
+    if state is None:
+        state = SearchState.for_graph(C)
+    state.reset()
+    gen, stamp = state.generation, state.stamp
+    dist, pred, handle = state.dist, state.pred, state.handle
+    potential = landmarks.potential
+
+    s = C.node_id(source)
+    t = C.node_id(target)
+    inf = float("inf")
+    h = {s: potential(s, t)}
+    stamp[s], dist[s], pred[s] = gen, 0, None
+    if h[s] != inf:
+        handle[s] = heap.insert({"key": h[s]}, s)
+
+    while heap:
+        u = heap.extract_min().name
+        if u == t:
+            break
+        du = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            d = du + weights[i]
+            if stamp[v] != gen:
+                h[v] = potential(v, t)
+                stamp[v], dist[v], pred[v] = gen, d, u
+                if h[v] != inf:
+                    handle[v] = heap.insert({"key": d + h[v]}, v)
+            elif d < dist[v] and h[v] != inf:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d + h[v])
+
+    return state.path(t)
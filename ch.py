@@ -0,0 +1,371 @@
+"""
+Contraction hierarchies (CH) for point-to-point shortest paths.
+
+Preprocessing contracts nodes one at a time in order of importance (edge
+difference plus number of contracted neighbors, updated lazily). Contracting v
+adds a shortcut u -> w of weight d(u, v) + d(v, w) unless a witness search that
+avoids v finds a path at least as short. The witness searches are bounded
+Dijkstra runs with the heaps from heaps/.
+
+The result is an upward graph (edges to higher ranked nodes) and a downward
+graph (edges from higher ranked nodes, stored reversed), both CSRGraphs with a
+parallel middle array naming the contracted node a shortcut bypasses (-1 for
+original edges). A query is a bidirectional search that only goes upward; the
+shortcuts on the path are then unpacked recursively.
+"""
+
+import heapq
+import os
+from array import array
+
+import numpy as np
+
+from csr import CSRGraph, SearchState, json_fingerprint
+from main import get_heap
+
+
+class ContractionHierarchy(object):
+    """Upward/downward search graphs of a contracted graph"""
+
+    def __init__(
+        self, rank, up, up_middle, down, down_middle, labels=None, fingerprint=None
+    ):
+        """fingerprint is the json_fingerprint of the graph json file the
+        hierarchy was built from, if any"""
+        self.rank = rank
+        self.up = up
+        self.up_middle = up_middle
+        self.down = down
+        self.down_middle = down_middle
+        self.labels = labels
+        self.index = None
+        if labels is not None:
+            self.index = {label: i for i, label in enumerate(labels)}
+        self.up.labels = self.down.labels = labels
+        self.up.index = self.down.index = self.index
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, G, heap_choice="MinHeap", settle_limit=64):
+        """Contract every node of G
+
+        settle_limit bounds the nodes settled by a single witness search; a
+        search cut short just adds a shortcut that was not strictly needed.
+        """
+        C = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+        return _Contractor(C, heap_choice, settle_limit).run()
+
+    @property
+    def num_nodes(self):
+        return len(self.rank)
+
+    def node_id(self, label):
+        return label if self.index is None else self.index[label]
+
+    def node_label(self, i):
+        return i if self.labels is None else self.labels[i]
+
+    def _arc(self, graph, middle, u, v):
+        """(weight, middle) of the arc u -> v stored at u in graph"""
+        targets = graph.targets
+        for i in range(graph.offsets[u], graph.offsets[u + 1]):
+            if targets[i] == v:
+                return graph.weights[i], middle[i]
+        raise KeyError((u, v))
+
+    def middle(self, u, v):
+        """Node bypassed by the CH edge u -> v, -1 for an original edge"""
+        if self.rank[u] < self.rank[v]:
+            return self._arc(self.up, self.up_middle, u, v)[1]
+        return self._arc(self.down, self.down_middle, v, u)[1]
+
+    def unpack(self, path):
+        """Expand the shortcuts on a path of node ids into original edges"""
+        unpacked = [path[0]]
+        stack = [(u, v) for u, v in zip(reversed(path[:-1]), reversed(path[1:]))]
+        while stack:
+            u, v = stack.pop()
+            m = self.middle(u, v)
+            if m == -1:
+                unpacked.append(v)
+            else:
+                stack.append((m, v))
+                stack.append((u, m))
+        return unpacked
+
+    def save(self, path):
+        """Write the hierarchy as an npz archive"""
+        tables = {
+            "rank": np.asarray(self.rank, dtype=np.int64),
+            "up_offsets": np.asarray(self.up.offsets, dtype=np.int64),
+            "up_targets": np.asarray(self.up.targets, dtype=np.int64),
+            "up_weights": np.asarray(self.up.weights),
+            "up_middle": np.asarray(self.up_middle, dtype=np.int64),
+            "down_offsets": np.asarray(self.down.offsets, dtype=np.int64),
+            "down_targets": np.asarray(self.down.targets, dtype=np.int64),
+            "down_weights": np.asarray(self.down.weights),
+            "down_middle": np.asarray(self.down_middle, dtype=np.int64),
+        }
+        if self.fingerprint is not None:
+            tables["fingerprint"] = np.asarray(self.fingerprint, dtype=np.int64)
+        with open(path, "wb") as f:
+            np.savez(f, **tables)
+
+    @classmethod
+    def load(cls, path, labels=None):
+        """Read a hierarchy written by save"""
+
+        def to_array(a):
+            return array("q" if a.dtype.kind == "i" else "d", a.tobytes())
+
+        with np.load(path) as t:
+            up = CSRGraph(
+                to_array(t["up_offsets"]),
+                to_array(t["up_targets"]),
+                to_array(t["up_weights"]),
+                directed=True,
+            )
+            down = CSRGraph(
+                to_array(t["down_offsets"]),
+                to_array(t["down_targets"]),
+                to_array(t["down_weights"]),
+                directed=True,
+            )
+            return cls(
+                to_array(t["rank"]),
+                up,
+                to_array(t["up_middle"]),
+                down,
+                to_array(t["down_middle"]),
+                labels,
+                t["fingerprint"].tolist() if "fingerprint" in t else None,
+            )
+
+
+class _Contractor(object):
+    """Mutable state of one contraction run"""
+
+    def __init__(self, C, heap_choice, settle_limit):
+        self.C = C
+        self.heap_choice = heap_choice
+        self.settle_limit = settle_limit
+        n = C.num_nodes
+
+        # out[u][v] = in_[v][u] = (weight, middle) over uncontracted nodes
+        self.out = [{} for _ in range(n)]
+        self.in_ = [{} for _ in range(n)]
+        for u in range(n):
+            for v, w in C.neighbors(u):
+                if u != v and (v not in self.out[u] or w < self.out[u][v][0]):
+                    self.out[u][v] = self.in_[v][u] = (w, -1)
+
+        self.rank = array("q", [-1]) * n
+        self.deleted = [0] * n
+        self.state = SearchState(n)
+        # Edges kept at contraction time, to higher ranked nodes only
+        self.up = [None] * n
+        self.down = [None] * n
+
+    def _witness(self, source, skip, max_dist):
+        """Bounded Dijkstra from source that avoids skip, returns its state"""
+        out, state = self.out, self.state
+        state.reset()
+        gen, stamp = state.generation, state.stamp
+        dist, handle = state.dist, state.handle
+        heap = get_heap(self.heap_choice)
+
+        stamp[source], dist[source] = gen, 0
+        handle[source] = heap.insert({"key": 0}, source)
+        settled = 0
+        while heap:
+            u = heap.extract_min().name
+            du = dist[u]
+            settled += 1
+            if du > max_dist or settled > self.settle_limit:
+                break
+            for v, (w, _) in out[u].items():
+                if v == skip:
+                    continue
+                d = du + w
+                if stamp[v] != gen:
+                    stamp[v], dist[v] = gen, d
+                    handle[v] = heap.insert({"key": d}, v)
+                elif d < dist[v]:
+                    dist[v] = d
+                    heap.decrease_key(handle[v], d)
+        return state
+
+    def _shortcuts(self, v):
+        """Shortcuts (u, w, weight) needed to contract v"""
+        shortcuts = []
+        outgoing = self.out[v]
+        if not outgoing:
+            return shortcuts
+        max_out = max(w for w, _ in outgoing.values())
+        for u, (w_in, _) in self.in_[v].items():
+            state = self._witness(u, v, w_in + max_out)
+            for w, (w_out, _) in outgoing.items():
+                if w != u and state.distance(w) > w_in + w_out:
+                    shortcuts.append((u, w, w_in + w_out))
+        return shortcuts
+
+    def _priority(self, v):
+        """Edge difference plus contracted neighbors, smaller goes first"""
+        removed = len(self.out[v]) + len(self.in_[v])
+        return len(self._shortcuts(v)) - removed + self.deleted[v]
+
+    def _contract(self, v, order):
+        out, in_ = self.out, self.in_
+        for u, w, weight in self._shortcuts(v):
+            if w not in out[u] or weight < out[u][w][0]:
+                out[u][w] = in_[w][u] = (weight, v)
+
+        self.rank[v] = order
+        self.up[v] = out[v]
+        self.down[v] = in_[v]
+        for w in out[v]:
+            del in_[w][v]
+            self.deleted[w] += 1
+        for u in in_[v]:
+            del out[u][v]
+            self.deleted[u] += 1
+        out[v] = in_[v] = None
+
+    def _to_csr(self, adjacency):
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = []
+        middle = array("q")
+        for edges in adjacency:
+            for v, (w, m) in edges.items():
+                targets.append(v)
+                weights.append(w)
+                middle.append(m)
+            offsets.append(len(targets))
+        typecode = "q" if all(isinstance(w, int) for w in weights) else "d"
+        graph = CSRGraph(offsets, targets, array(typecode, weights), directed=True)
+        return graph, middle
+
+    def run(self):
+        n = self.C.num_nodes
+        queue = [(self._priority(v), v) for v in range(n)]
+        heapq.heapify(queue)
+
+        order = 0
+        while queue:
+            _, v = heapq.heappop(queue)
+            # Lazy update: re-queue v if its priority grew past the next node's
+            priority = self._priority(v)
+            if queue and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, v))
+                continue
+            self._contract(v, order)
+            order += 1
+
+        up, up_middle = self._to_csr(self.up)
+        down, down_middle = self._to_csr(self.down)
+        return ContractionHierarchy(
+            self.rank, up, up_middle, down, down_middle, self.C.labels
+        )
+
+
+def ch_file(graph_file):
+    """Path of the hierarchy stored next to a graph json file"""
+    root, _ = os.path.splitext(graph_file)
+    return f"{root}.ch.npz"
+
+
+def load_or_build(graph_file, heap_choice="MinHeap"):
+    """Load a graph json file and its hierarchy, building it if needed
+
+    Returns (CSRGraph, ContractionHierarchy). A hierarchy built from a
+    different version of the json file (by json_fingerprint) is rebuilt and
+    overwritten.
+    """
+    C = CSRGraph.from_json(graph_file)
+    path = ch_file(graph_file)
+    fingerprint = json_fingerprint(graph_file)
+
+    if os.path.exists(path):
+        ch = ContractionHierarchy.load(path, C.labels)
+        if ch.fingerprint == fingerprint and ch.num_nodes == C.num_nodes:
+            return C, ch
+
+    ch = ContractionHierarchy.build(C, heap_choice)
+    ch.fingerprint = fingerprint
+    ch.save(path)
+    return C, ch
+
+
+def ch_path_heaps(ch, source, target, heap_choice, states=None):
+    """Shortest path query on a ContractionHierarchy
+
+    A forward search over the upward graph and a backward search over the
+    downward graph, each with its own heap from get_heap, alternate until every
+    key left on a side is at least the best meeting distance mu. Returns the
+    unpacked path of node names, [target] if it is unreachable.
+    """
+    graphs = (ch.up, ch.down)
+    if states is None:
+        states = (SearchState(ch.num_nodes), SearchState(ch.num_nodes))
+    heaps = [get_heap(heap_choice), get_heap(heap_choice)]
+
+    s = ch.node_id(source)
+    t = ch.node_id(target)
+    for state, heap, v in zip(states, heaps, (s, t)):
+        state.reset()
+        state.stamp[v], state.dist[v], state.pred[v] = state.generation, 0, None
+        state.handle[v] = heap.insert({"key": 0}, v)
+
+    mu = 0 if s == t else float("inf")
+    meet = s
+    side = 1
+
+    while heaps[0] or heaps[1]:
+        if heaps[1 - side]:
+            side = 1 - side
+        heap = heaps[side]
+        graph, state, other = graphs[side], states[side], states[1 - side]
+        gen, stamp = state.generation, state.stamp
+        dist, pred, handle = state.dist, state.pred, state.handle
+
+        u = heap.extract_min().name
+        du = dist[u]
+        if du >= mu:
+            # Nothing left on this side can improve mu
+            heaps[side] = None
+            continue
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            d = du + weights[i]
+            if stamp[v] != gen:
+                stamp[v], dist[v], pred[v] = gen, d, u
+                handle[v] = heap.insert({"key": d}, v)
+            elif d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d)
+            else:
+                continue
+            if other.reached(v) and d + other.dist[v] < mu:
+                mu = d + other.dist[v]
+                meet = v
+
+    if mu == float("inf"):
+        return [target]
+
+    forward, backward = states
+    path = []
+    v = meet
+    while v is not None:
+        path.append(v)
+        v = forward.pred[v]
+    path.reverse()
+    v = backward.pred[meet]
+    while v is not None:
+        path.append(v)
+        v = backward.pred[v]
+
+    return [ch.node_label(v) for v in ch.unpack(path)]
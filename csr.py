@@ -0,0 +1,360 @@
+"""
+Compressed sparse row (CSR) graph representation for Dijkstra's algorithm.
+
+Nodes are renumbered to integer ids 0..n-1 and the out-edges of node u live in
+targets[offsets[u]:offsets[u + 1]] with matching weights, so a relaxation is a
+couple of array reads instead of several NetworkX dict lookups. SearchState
+holds the per-query distances and predecessors beside the graph.
+
+save/load keep a CSRGraph in a binary file next to its graph json file as
+<graph>.csr: a 64 byte header (including the size and mtime of the json it
+was converted from, see json_fingerprint) followed by the offsets, targets and weights as
+raw 8 byte native-endian arrays, then the node labels as json when they are not
+the ids. load maps the file and reads the arrays in place, with no parsing or
+copying, either as memoryviews (elements are Python numbers, like array) or
+as numpy.memmap arrays.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+
+import numpy as np
+
+# magic, version, flags, num_nodes, num_arcs, label bytes, source json size and
+# mtime, padded to 64 bytes
+HEADER = struct.Struct("<8sIIqqqqq8x")
+MAGIC = b"CSRGRAPH"
+VERSION = 2
+DIRECTED = 1
+FLOAT_WEIGHTS = 2
+
+
+def csr_file(graph_file):
+    """Path of the binary CSR graph stored next to a graph json file"""
+    root, _ = os.path.splitext(graph_file)
+    return f"{root}.csr"
+
+
+def json_fingerprint(graph_file):
+    """[size, mtime_ns] of a graph json file, stored with the files derived
+    from it so they can tell when the graph has been regenerated"""
+    st = os.stat(graph_file)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def typecode(a):
+    """array typecode ("q" or "d") of an array, memoryview or numpy array"""
+    if isinstance(a, array):
+        return a.typecode
+    if isinstance(a, memoryview):
+        return a.format
+    return "q" if a.dtype.kind in "iu" else "d"
+
+
+class CSRGraph(object):
+    """Static weighted graph stored as offset/target/weight arrays."""
+
+    def __init__(self, offsets, targets, weights, labels=None, directed=False):
+        """labels[i] is the original name of node i, None means names are ids"""
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.labels = labels
+        self.index = None
+        if labels is not None:
+            self.index = {label: i for i, label in enumerate(labels)}
+        self.directed = directed
+        self._reverse = None
+
+    @classmethod
+    def from_adjacency(cls, labels, adjacency, directed=False):
+        """Build from node labels and per-node lists of (neighbor, weight)"""
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = []
+        for neighbors in adjacency:
+            for v, w in neighbors:
+                targets.append(index[v])
+                weights.append(w)
+            offsets.append(len(targets))
+
+        # Keep integer weights integral so distances match the NetworkX runs
+        typecode = "q" if all(isinstance(w, int) for w in weights) else "d"
+        weights = array(typecode, weights)
+
+        if all(label == i for i, label in enumerate(labels)):
+            labels = None
+        else:
+            labels = list(labels)
+
+        return cls(offsets, targets, weights, labels, directed)
+
+    @classmethod
+    def from_networkx(cls, G, weight="weight"):
+        """Build from a NetworkX graph, undirected edges are stored both ways"""
+        labels = list(G.nodes)
+        adjacency = (
+            [(v, attrs.get(weight, 1)) for v, attrs in G.adj[u].items()] for u in labels
+        )
+        return cls.from_adjacency(labels, adjacency, G.is_directed())
+
+    @classmethod
+    def from_json(cls, path):
+        """Build straight from a NetworkX adjacency JSON file in test_graphs"""
+        with open(path) as f:
+            adj_data = json.load(f)
+
+        labels = [node["id"] for node in adj_data["nodes"]]
+        adjacency = (
+            [(edge["id"], edge.get("weight", 1)) for edge in neighbors]
+            for neighbors in adj_data["adjacency"]
+        )
+        return cls.from_adjacency(labels, adjacency, adj_data["directed"])
+
+    def save(self, path, fingerprint=(0, 0)):
+        """Write the graph as a binary CSR file
+
+        fingerprint is the json_fingerprint of the json the graph came from.
+        The file is written under a temporary name and renamed into place, so
+        a process that has the old file mapped keeps reading the old file.
+        """
+        flags = (DIRECTED if self.directed else 0) | (
+            FLOAT_WEIGHTS if typecode(self.weights) == "d" else 0
+        )
+        labels = b"" if self.labels is None else json.dumps(self.labels).encode()
+        tmp = f"{path}.{os.getpid()}"
+        with open(tmp, "wb") as f:
+            f.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    flags,
+                    self.num_nodes,
+                    len(self.targets),
+                    len(labels),
+                    *fingerprint,
+                )
+            )
+            weights_dtype = np.float64 if flags & FLOAT_WEIGHTS else np.int64
+            f.write(np.asarray(self.offsets, dtype=np.int64).tobytes())
+            f.write(np.asarray(self.targets, dtype=np.int64).tobytes())
+            f.write(np.asarray(self.weights, dtype=weights_dtype).tobytes())
+            f.write(labels)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def read_header(path):
+        """Header of a binary CSR file, with the byte offset of each array
+
+        The arrays can be mapped directly, e.g.
+        numpy.memmap(path, header["weights_dtype"], "r", header["weights"],
+        (header["num_arcs"],)).
+        """
+        with open(path, "rb") as f:
+            data = f.read(HEADER.size)
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a CSR graph file")
+        magic, version, flags, n, m, label_bytes, size, mtime = HEADER.unpack(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} CSR graph file")
+        offsets = HEADER.size
+        targets = offsets + 8 * (n + 1)
+        weights = targets + 8 * m
+        return {
+            "directed": bool(flags & DIRECTED),
+            "weights_dtype": np.float64 if flags & FLOAT_WEIGHTS else np.int64,
+            "num_nodes": n,
+            "num_arcs": m,
+            "offsets": offsets,
+            "targets": targets,
+            "weights": weights,
+            "labels": weights + 8 * m,
+            "label_bytes": label_bytes,
+            "fingerprint": [size, mtime],
+        }
+
+    @classmethod
+    def load(cls, path, numpy=False):
+        """Map a binary CSR file written by save
+
+        The arrays are views of the mapped file, so loading only reads the
+        header (and the labels, if any). With numpy=True they are
+        numpy.memmap arrays instead of memoryviews.
+        """
+        header = cls.read_header(path)
+        n, m = header["num_nodes"], header["num_arcs"]
+        weights_dtype = header["weights_dtype"]
+
+        if numpy:
+            offsets = np.memmap(path, np.int64, "r", header["offsets"], (n + 1,))
+            targets = np.memmap(path, np.int64, "r", header["targets"], (m,))
+            weights = np.memmap(path, weights_dtype, "r", header["weights"], (m,))
+        else:
+            with open(path, "rb") as f:
+                buf = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+            def view(start, length, code="q"):
+                return buf[start : start + 8 * length].cast(code)
+
+            offsets = view(header["offsets"], n + 1)
+            targets = view(header["targets"], m)
+            weights = view(
+                header["weights"], m, "d" if weights_dtype is np.float64 else "q"
+            )
+
+        labels = None
+        if header["label_bytes"]:
+            with open(path, "rb") as f:
+                f.seek(header["labels"])
+                labels = json.loads(f.read(header["label_bytes"]))
+        return cls(offsets, targets, weights, labels, header["directed"])
+
+    @staticmethod
+    def is_current(path, graph_file):
+        """Whether the binary CSR file path was converted from graph_file as it
+        is now"""
+        try:
+            header = CSRGraph.read_header(path)
+        except (OSError, ValueError):
+            return False
+        return header["fingerprint"] == json_fingerprint(graph_file)
+
+    @classmethod
+    def convert_json(cls, graph_file, path=None):
+        """Write the binary CSR file for a graph json file, return its path"""
+        if path is None:
+            path = csr_file(graph_file)
+        cls.from_json(graph_file).save(path, json_fingerprint(graph_file))
+        return path
+
+    @property
+    def num_nodes(self):
+        return len(self.offsets) - 1
+
+    def number_of_nodes(self):
+        return self.num_nodes
+
+    def number_of_edges(self):
+        """Number of edges, counting undirected edges once like NetworkX"""
+        arcs = len(self.targets)
+        return arcs if self.directed else arcs // 2
+
+    def node_id(self, label):
+        """Map an original node name to its integer id"""
+        return label if self.index is None else self.index[label]
+
+    def node_label(self, i):
+        """Map an integer id back to the original node name"""
+        return i if self.labels is None else self.labels[i]
+
+    def reverse(self):
+        """Graph with every edge reversed, an undirected graph is its own reverse"""
+        if not self.directed:
+            return self
+        if self._reverse is None:
+            n = self.num_nodes
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+
+            # Counting sort of the edges by target
+            counts = [0] * (n + 1)
+            for v in targets:
+                counts[v + 1] += 1
+            for v in range(n):
+                counts[v + 1] += counts[v]
+            rev_offsets = array("q", counts)
+
+            rev_targets = array("q", [0]) * len(targets)
+            rev_weights = array(typecode(weights), [0]) * len(weights)
+            for u in range(n):
+                for i in range(offsets[u], offsets[u + 1]):
+                    j = counts[targets[i]]
+                    counts[targets[i]] += 1
+                    rev_targets[j] = u
+                    rev_weights[j] = weights[i]
+
+            self._reverse = CSRGraph(
+                rev_offsets, rev_targets, rev_weights, None, directed=True
+            )
+            self._reverse.labels, self._reverse.index = self.labels, self.index
+            self._reverse._reverse = self
+        return self._reverse
+
+    def __contains__(self, label):
+        """Whether label names a node of the graph"""
+        if self.index is not None:
+            try:
+                return label in self.index
+            except TypeError:
+                return False
+        return isinstance(label, int) and 0 <= label < self.num_nodes
+
+    def neighbors(self, u):
+        """Iterate (v, weight) pairs for the out-edges of node id u"""
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            yield self.targets[i], self.weights[i]
+
+    def __repr__(self):
+        return (
+            f"CSRGraph(num_nodes={self.num_nodes}, num_edges={self.number_of_edges()})"
+        )
+
+
+class SearchState(object):
+    """Per-query Dijkstra working state kept beside a read-only graph.
+
+    dist/pred/handle[v] are only meaningful while stamp[v] == generation, so
+    reset() bumps the generation in O(1) instead of clearing all V entries.
+    One graph can be shared by any number of queries, each with its own state.
+    """
+
+    def __init__(self, num_nodes, labels=None, index=None):
+        self.dist = [float("inf")] * num_nodes
+        self.pred = [None] * num_nodes
+        self.handle = [None] * num_nodes
+        self.stamp = array("q", [0]) * num_nodes
+        self.generation = 0
+        self.labels = labels
+        self.index = index
+
+    @classmethod
+    def for_graph(cls, G):
+        """Size a state for a CSRGraph or a NetworkX graph"""
+        if isinstance(G, CSRGraph):
+            return cls(G.num_nodes, G.labels, G.index)
+
+        labels = list(G.nodes)
+        if all(label == i for i, label in enumerate(labels)):
+            return cls(len(labels))
+        return cls(len(labels), labels, {label: i for i, label in enumerate(labels)})
+
+    def reset(self):
+        """Invalidate every entry for the next query"""
+        self.generation += 1
+
+    def node_id(self, label):
+        return label if self.index is None else self.index[label]
+
+    def node_label(self, i):
+        return i if self.labels is None else self.labels[i]
+
+    def reached(self, v):
+        """Whether node id v has been reached by the current query"""
+        return self.stamp[v] == self.generation
+
+    def distance(self, v):
+        """Tentative distance of node id v in the current query"""
+        return self.dist[v] if self.stamp[v] == self.generation else float("inf")
+
+    def path(self, target):
+        """Node names on the shortest path to node id target"""
+        path = [self.node_label(target)]
+        v = self.pred[target] if self.reached(target) else None
+        while v is not None:
+            path.append(self.node_label(v))
+            v = self.pred[v]
+        path.reverse()
+        return path
@@ -12,6 +12,21 @@ class Heap(object):
         '''insert a new vertex into heap'''
         pass
 
+    def insert_many(self, items):
+        '''insert (data, name) pairs, return their nodes in order'''
+        return [self.insert(data, name) for data, name in items]
+
+    def meld(self, other):
+        '''move every element of other into this heap, leaving other empty
+
+        Fallback: drain other and reinsert each node's data with its current
+        key, so handles from other are not valid in this heap; heaps that can
+        move their nodes override it.'''
+        while len(other):
+            node = other.extract_min()
+            data = dict(getattr(node, "data", None) or {}, key=node.key)
+            self.insert(data, node.name)
+
     def extract_min(self):
         '''delete minimum'''
         pass
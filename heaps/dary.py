@@ -0,0 +1,125 @@
+from heaps.base import Heap
+
+
+class DAryHeap(Heap):
+    """d-ary min-heap priority queue
+
+    Nodes live in one flat list where the children of position i are
+    d*i + 1 .. d*i + d, and every node stores its position. decrease_key sifts
+    up through log_d(n) levels; extract_min sifts down comparing d children per
+    level, so wider heaps favour decrease_key heavy workloads.
+    """
+
+    class Node:
+        def __init__(self, data: dict, name=None):
+            self.key = data["key"]
+            self.name = name
+            self.data = data
+            # Index into DAryHeap.heap, None once extracted
+            self.pos = None
+
+    def __init__(self, d=4):
+        if d < 2:
+            raise ValueError("DAryHeap arity must be at least 2")
+        self.d = d
+        self.heap = []
+
+    def _upheap(self, pos):
+        """up-heap element at given pos in heap array"""
+        heap, d = self.heap, self.d
+        node = heap[pos]
+        while pos:
+            parent = (pos - 1) // d
+            if not node.key < heap[parent].key:
+                break
+            heap[pos] = heap[parent]
+            heap[pos].pos = pos
+            pos = parent
+        heap[pos] = node
+        node.pos = pos
+
+    def _downheap(self, pos=0):
+        """down-heap element at given pos in heap array"""
+        heap, d = self.heap, self.d
+        size = len(heap)
+        node = heap[pos]
+        while True:
+            first = d * pos + 1
+            if first >= size:
+                break
+            child = first
+            for i in range(first + 1, min(first + d, size)):
+                if heap[i].key < heap[child].key:
+                    child = i
+            if not heap[child].key < node.key:
+                break
+            heap[pos] = heap[child]
+            heap[pos].pos = pos
+            pos = child
+        heap[pos] = node
+        node.pos = pos
+
+    def insert(self, data: dict, name=None):
+        node = self.Node(data, name)
+        self.heap.append(node)
+        self._upheap(len(self.heap) - 1)
+        return node
+
+    def _extend(self, nodes):
+        """add nodes, heapifying bottom-up in O(n) when there are at least as
+        many as in the heap"""
+        heap = self.heap
+        if len(nodes) < len(heap):
+            for node in nodes:
+                heap.append(node)
+                self._upheap(len(heap) - 1)
+            return
+
+        heap.extend(nodes)
+        for pos, node in enumerate(heap):
+            node.pos = pos
+        for pos in range((len(heap) - 2) // self.d, -1, -1):
+            self._downheap(pos)
+
+    def insert_many(self, items):
+        """insert (data, name) pairs, return their nodes in order"""
+        nodes = [self.Node(data, name) for data, name in items]
+        self._extend(nodes)
+        return nodes
+
+    def meld(self, other):
+        """move the nodes of other into this heap, leaving other empty"""
+        nodes, other.heap = other.heap, []
+        self._extend(nodes)
+
+    def find_min(self):
+        if not self.heap:
+            return None
+        return self.heap[0]
+
+    def extract_min(self) -> Node:
+        """delete minimum element"""
+        if not self.heap:
+            return None
+
+        heap = self.heap
+        smallest = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._downheap(0)
+        smallest.pos = None
+        return smallest
+
+    def decrease_key(self, node: Node, key):
+        if key >= node.key:
+            raise ValueError("Cannot decrease key with value >= current key")
+        if node.pos is not None:
+            node.key = key
+            self._upheap(node.pos)
+
+    def show(self):
+        print([node.key for node in self.heap])
+
+    def __len__(self):
+        return len(self.heap)
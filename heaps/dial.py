@@ -0,0 +1,162 @@
+''' Dial Bucket Queue Implementation.
+
+Monotone priority queue for non-negative integer keys. With edge weights of at
+most C, every key in Dijkstra's queue lies in [last, last + C], so a circular
+array of C + 1 buckets indexed by key % (C + 1) holds them all and extract_min
+only scans forward from the last extracted key. Keys outside that window (and
+inf) wait in an overflow list until the window reaches them.
+
+References:
+Dial - Algorithm 360: Shortest-path forest with topological ordering (1969)
+'''
+
+from heaps.base import Heap
+
+
+class DialHeap(Heap):
+    '''Dial bucket queue priority queue'''
+
+    class Node:
+        def __init__(self, data: dict, name=None):
+            self.key = data["key"]
+            self.name = name
+            self.data = data
+            # Bucket list holding the node and its index there, None once extracted
+            self.bucket = None
+            self.pos = None
+
+    def __init__(self, width=1000):
+        '''width is the largest key span at once, the maximum edge weight'''
+        self.width = width
+        self.buckets = [[] for _ in range(width + 1)]
+        self.overflow = []
+        # Lower bound on the finite keys in overflow
+        self.overflow_min = float("inf")
+        # Key of the bucket under the cursor, never more than the minimum key
+        self.last = 0
+        self.in_buckets = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _place(self, node):
+        '''Append node to its circular bucket, or to overflow if out of window'''
+        key = node.key
+        if key < self.last:
+            raise ValueError("DialHeap keys must be >= the last extracted key")
+        if key - self.last <= self.width:
+            if key != int(key):
+                raise ValueError("DialHeap keys must be integers")
+            bucket = self.buckets[int(key) % (self.width + 1)]
+            self.in_buckets += 1
+        else:
+            bucket = self.overflow
+            if key < self.overflow_min:
+                self.overflow_min = key
+        node.bucket = bucket
+        node.pos = len(bucket)
+        bucket.append(node)
+
+    def _remove(self, node):
+        '''Swap-remove node from its bucket in O(1)'''
+        bucket = node.bucket
+        last = bucket.pop()
+        if last is not node:
+            bucket[node.pos] = last
+            last.pos = node.pos
+        if bucket is not self.overflow:
+            self.in_buckets -= 1
+        node.bucket = node.pos = None
+
+    def _spill(self):
+        '''Move overflow nodes that fit the window into buckets
+
+        If the window is empty it first jumps to the smallest finite overflow key.
+        '''
+        if not self.in_buckets:
+            finite = [node.key for node in self.overflow if node.key != float("inf")]
+            if not finite:
+                return
+            self.last = int(min(finite))
+        overflow, self.overflow = self.overflow, []
+        self.overflow_min = float("inf")
+        for node in overflow:
+            self._place(node)
+
+    def _advance(self):
+        '''Move the cursor to the first non-empty bucket, return it or None'''
+        buckets, size = self.buckets, self.width + 1
+        while True:
+            if self.overflow_min <= self.last or not self.in_buckets:
+                self._spill()
+                if not self.in_buckets:
+                    return None
+            bucket = buckets[self.last % size]
+            if bucket:
+                return bucket
+            self.last += 1
+
+    def insert(self, data: dict, name=None):
+        node = self.Node(data, name)
+        self._place(node)
+        self.count += 1
+        return node
+
+    def meld(self, other):
+        '''Move the nodes of other into this heap, leaving other empty
+
+        If other has extracted less far, the cursor moves back to its last key
+        and every node of this heap is re-placed as well.
+        '''
+        nodes = [node for bucket in other.buckets for node in bucket]
+        nodes += other.overflow
+        if nodes and other.last < self.last:
+            nodes += [node for bucket in self.buckets for node in bucket]
+            nodes += self.overflow
+            self.buckets = [[] for _ in range(self.width + 1)]
+            self.overflow = []
+            self.overflow_min = float("inf")
+            self.in_buckets = 0
+            self.last = other.last
+        for node in nodes:
+            self._place(node)
+        self.count += other.count
+        other.buckets = [[] for _ in range(other.width + 1)]
+        other.overflow = []
+        other.overflow_min = float("inf")
+        other.in_buckets = other.count = 0
+
+    def find_min(self):
+        bucket = self._advance()
+        if bucket is not None:
+            return bucket[-1]
+        return self.overflow[-1] if self.overflow else None
+
+    def extract_min(self):
+        if self.count == 0:
+            raise ValueError("Cannot extract minimum: DialHeap is empty.")
+        node = self.find_min()
+        self._remove(node)
+        self.count -= 1
+        return node
+
+    def decrease_key(self, node, key):
+        if key >= node.key:
+            raise ValueError("Cannot decrease key with value >= current key")
+        if key < self.last:
+            raise ValueError("DialHeap keys must be >= the last extracted key")
+        if node.bucket is None:
+            return
+        self._remove(node)
+        node.key = key
+        self._place(node)
+
+    def show(self):
+        size = self.width + 1
+        for i in range(size):
+            bucket = self.buckets[(self.last + i) % size]
+            if bucket:
+                print(f"{self.last + i}: {[node.name for node in bucket]}")
+        if self.overflow:
+            print(f"overflow: {[node.key for node in self.overflow]}")
@@ -1,5 +1,10 @@
+from math import log
+
 from heaps.base import Heap
 
+# log base phi, bounds the degree of any node in an n node Fibonacci heap
+LOG_PHI = log((1 + 5**0.5) / 2)
+
 # https://rosettacode.org/wiki/Fibonacci_heap#Python
 class FibHeap(Heap):
     """Fibonacci heap priority queue"""
@@ -13,12 +18,15 @@ class FibHeap(Heap):
             self.mark = False
             self.data = data
 
-    # Pointer to element of doubly linked root list
-    root_list = None
-    # Pointer to node with minimum element on heap
-    min_node = None
-    # Num nodes in heap
-    total_nodes = 0
+    def __init__(self):
+        # Pointer to element of doubly linked root list
+        self.root_list = None
+        # Pointer to node with minimum element on heap
+        self.min_node = None
+        # Num nodes in heap
+        self.total_nodes = 0
+        # Roots by degree, reused by every consolidation and left all None
+        self.degree_table = []
 
     def __len__(self):
         return self.total_nodes
@@ -36,6 +44,31 @@ class FibHeap(Heap):
         self.total_nodes += 1
         return node
 
+    # Insert (data, name) pairs as one ring spliced into the root list
+    def insert_many(self, items):
+        nodes = [self.Node(data, name) for data, name in items]
+        if not nodes:
+            return nodes
+        smallest = nodes[0]
+        prev = nodes[-1]
+        for node in nodes:
+            node.left, prev.right = prev, node
+            prev = node
+            if node.key < smallest.key:
+                smallest = node
+        if self.root_list is None:
+            self.root_list = nodes[0]
+        else:
+            first, last = nodes[0], nodes[-1]
+            last.right = self.root_list.right
+            self.root_list.right.left = last
+            self.root_list.right = first
+            first.left = self.root_list
+        if self.min_node is None or smallest.key < self.min_node.key:
+            self.min_node = smallest
+        self.total_nodes += len(nodes)
+        return nodes
+
     # Iterate through a doubly linked list
     def _iterate(self, head=None):
         if head is None:
@@ -53,19 +86,17 @@ class FibHeap(Heap):
         smallest = self.min_node
         if smallest is None:
             raise ValueError("Cannot extract minimum: FibHeap is empty.")
-        if smallest is not None:
-            children = [x for x in self._iterate(smallest.child)]
-            for i in range(0, len(children)):
-                self._merge_with_root_list(children[i])
-                children[i].parent = None
+        # Splice the child list into the root list in O(1),
+        # their parent pointers are cleared by _consolidate
+        if smallest.child is not None:
+            self._splice(smallest, smallest.child)
+            smallest.child = None
         self._remove_from_root_list(smallest)
+        smallest.left = smallest.right = smallest
         self.total_nodes -= 1
-        # Update min
-        if smallest == smallest.right:
-            self.min_node = self.root_list = None
+        if self.root_list is None:
+            self.min_node = None
         else:
-            # self.min_node = smallest.right
-            self.min_node = self._find_min_node()
             self._consolidate()
         return smallest
 
@@ -81,23 +112,21 @@ class FibHeap(Heap):
         if node.key < self.min_node.key:
             self.min_node = node
 
-    # Merge two trees in O(1) by concatenating root list
-    def _merge(self, fh: "FibHeap") -> "FibHeap":
-        if fh.total_nodes == 0:
+    # Meld fh into this heap in O(1) by concatenating root lists, fh is left empty
+    def meld(self, fh: "FibHeap"):
+        if fh.root_list is None:
             return
-        H = FibHeap()
-        H.root_list, H.min_node = self.root_list, self.min_node
-        last = fh.root_list.left
-        fh.root_list.left = H.root_list.left
-        H.root_list.left.right = fh.root_list
-        H.root_list.left = last
-        H.root_list.left.right = H.root_list
-        # update min node if needed
-        if fh.min_node.key < H.min_node.key:
-            H.min_node = fh.min_node
+        if self.root_list is None:
+            self.root_list, self.min_node = fh.root_list, fh.min_node
+        else:
+            self._splice(self.root_list, fh.root_list)
+            # update min node if needed
+            if fh.min_node.key < self.min_node.key:
+                self.min_node = fh.min_node
         # update total nodes
-        H.total_nodes = self.total_nodes + fh.total_nodes
-        return H
+        self.total_nodes += fh.total_nodes
+        fh.root_list = fh.min_node = None
+        fh.total_nodes = 0
 
     # If child node becomes smaller than parent node,
     # cut child node off and move to  root list
@@ -108,31 +137,60 @@ class FibHeap(Heap):
         node.parent = None
         node.mark = False
 
+    # Mark node on losing its first child, cut it on losing a second
     def _cascading_cut(self, node: Node):
         p = node.parent
         if p is not None:
-            if p.mark is False:
-                p.mark = True
+            if node.mark is False:
+                node.mark = True
             else:
                 self._cut(node, p)
                 self._cascading_cut(p)
 
-    # Consolidate root nodes of equal degree
+    # Consolidate root nodes of equal degree and find the new min node
     def _consolidate(self):
         if self.root_list is None:
             return
-        ranks_mapping = [None] * self.total_nodes
-        nodes = [x for x in self._iterate(self.root_list)]
-        for node in nodes:
+        table = self.degree_table
+        size = int(log(self.total_nodes) / LOG_PHI) + 2
+        if len(table) < size:
+            table.extend([None] * (size - len(table)))
+
+        roots = 1
+        node = self.root_list.right
+        while node is not self.root_list:
+            roots += 1
+            node = node.right
+
+        node = self.root_list
+        for _ in range(roots):
+            next = node.right
+            node.parent = None
             degree = node.degree
-            while ranks_mapping[degree] != None:
-                other = ranks_mapping[degree]
-                if node.key > other.key:
+            while table[degree] is not None:
+                other = table[degree]
+                if other.key < node.key:
                     node, other = other, node
                 self._heap_link(node, other)
-                ranks_mapping[degree] = None
+                table[degree] = None
                 degree += 1
-            ranks_mapping[degree] = node
+            table[degree] = node
+            node = next
+
+        self.min_node = None
+        for degree in range(size):
+            node = table[degree]
+            if node is not None:
+                if self.min_node is None or node.key < self.min_node.key:
+                    self.min_node = node
+                table[degree] = None
+        self.root_list = self.min_node
+
+    # Join the circular lists containing a and b in O(1)
+    def _splice(self, a: Node, b: Node):
+        a_right, b_right = a.right, b.right
+        a.right, b_right.left = b_right, a
+        b.right, a_right.left = a_right, b
 
     def _merge_with_root_list(self, node: Node):
         if self.root_list is None:
@@ -183,17 +241,6 @@ class FibHeap(Heap):
         other.parent = node
         other.mark = False
 
-    # Iterate through list to find minimum node
-    def _find_min_node(self):
-        if self.root_list is None:
-            return None
-        else:
-            smallest = self.root_list
-            for x in self._iterate(self.root_list):
-                if x.key < smallest.key:
-                    smallest = x
-            return smallest
-
     def show(self):
         if self.root_list is not None:
             count = 0
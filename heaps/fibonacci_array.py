@@ -0,0 +1,302 @@
+from array import array
+from collections import namedtuple
+from math import log
+
+from heaps.base import Heap
+
+# log base phi, bounds the degree of any node in an n node Fibonacci heap
+LOG_PHI = log((1 + 5**0.5) / 2)
+
+
+class FibArrayHeap(Heap):
+    """Fibonacci heap priority queue stored as parallel arrays
+
+    Same algorithm as FibHeap, but node i is a slot in preallocated arrays
+    (key, parent, child, left, right, degree, mark) instead of an object, so a
+    million node heap is a handful of flat buffers. insert returns the integer
+    slot as the handle for decrease_key; extract_min and find_min return an
+    Entry(name, key). meld moves the slots of the other heap by the offset it
+    returns, and a slot that was never handed out is rejected by decrease_key.
+    """
+
+    Entry = namedtuple("Entry", ["name", "key"])
+
+    # Keys are stored in array("d"), see heaps.instrument
+    TYPED_KEYS = True
+
+    # Sentinels stored in parent
+    NONE = -1
+    EXTRACTED = -2
+
+    def __init__(self, capacity=0):
+        """capacity is the expected number of inserts, e.g. the vertex count"""
+        self.key = array("d", [0.0]) * capacity
+        self.parent = array("q", [-1]) * capacity
+        self.child = array("q", [-1]) * capacity
+        self.left = array("q", [-1]) * capacity
+        self.right = array("q", [-1]) * capacity
+        self.degree = array("q", [0]) * capacity
+        self.mark = bytearray(capacity)
+        self.name = [None] * capacity
+        # Slots handed out so far
+        self.size = 0
+        # Slot of the minimum root, -1 when empty
+        self.min = -1
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        """Double the capacity of every array"""
+        extra = max(len(self.name), 16)
+        self.key.extend(array("d", [0.0]) * extra)
+        for arr in (self.parent, self.child, self.left, self.right):
+            arr.extend(array("q", [-1]) * extra)
+        self.degree.extend(array("q", [0]) * extra)
+        self.mark.extend(bytearray(extra))
+        self.name.extend([None] * extra)
+
+    def _splice(self, a, b):
+        """Join the circular lists containing slots a and b in O(1)"""
+        left, right = self.left, self.right
+        a_next, b_next = right[a], right[b]
+        right[a], left[b_next] = b_next, a
+        right[b], left[a_next] = a_next, b
+
+    def _unlink(self, x):
+        """Remove slot x from its circular list"""
+        left, right = self.left, self.right
+        right[left[x]] = right[x]
+        left[right[x]] = left[x]
+        left[x] = right[x] = x
+
+    def insert(self, data: dict, name=None):
+        x = self.size
+        if x == len(self.name):
+            self._grow()
+        self.size += 1
+
+        self.key[x] = data["key"]
+        self.name[x] = name
+        self.parent[x] = self.child[x] = self.NONE
+        self.left[x] = self.right[x] = x
+        self.degree[x] = 0
+        self.mark[x] = 0
+
+        if self.min == -1:
+            self.min = x
+        else:
+            self._splice(self.min, x)
+            if self.key[x] < self.key[self.min]:
+                self.min = x
+        self.count += 1
+        return x
+
+    def insert_many(self, items):
+        """insert (data, name) pairs as one ring spliced into the root list"""
+        items = list(items)
+        first = self.size
+        while self.size + len(items) > len(self.name):
+            self._grow()
+        if not items:
+            return []
+        key, name, left, right = self.key, self.name, self.left, self.right
+        smallest = first
+        x = first
+        for data, label in items:
+            key[x] = data["key"]
+            name[x] = label
+            self.parent[x] = self.child[x] = self.NONE
+            left[x], right[x] = x - 1, x + 1
+            self.degree[x] = 0
+            self.mark[x] = 0
+            if key[x] < key[smallest]:
+                smallest = x
+            x += 1
+        last = x - 1
+        left[first], right[last] = last, first
+        self.size = x
+
+        if self.min == -1:
+            self.min = smallest
+        else:
+            self._splice(self.min, first)
+            if key[smallest] < key[self.min]:
+                self.min = smallest
+        self.count += len(items)
+        return list(range(first, x))
+
+    def meld(self, other):
+        """Append the slots of other after the slots of this heap and splice the
+        root lists, leaving other empty. Returns the slot offset: handle h of
+        other is handle h + offset of this heap."""
+        offset, n = self.size, other.size
+        while self.size + n > len(self.name):
+            self._grow()
+        end = offset + n
+
+        def shifted(arr):
+            # Slots move by offset, the NONE / EXTRACTED sentinels stay
+            return array("q", (x + offset if x >= 0 else x for x in arr[:n]))
+
+        self.key[offset:end] = other.key[:n]
+        self.parent[offset:end] = shifted(other.parent)
+        self.child[offset:end] = shifted(other.child)
+        self.left[offset:end] = shifted(other.left)
+        self.right[offset:end] = shifted(other.right)
+        self.degree[offset:end] = other.degree[:n]
+        self.mark[offset:end] = other.mark[:n]
+        self.name[offset:end] = other.name[:n]
+        self.size = end
+
+        if other.min != -1:
+            m = other.min + offset
+            if self.min == -1:
+                self.min = m
+            else:
+                self._splice(self.min, m)
+                if self.key[m] < self.key[self.min]:
+                    self.min = m
+        self.count += other.count
+        other.__init__()
+        return offset
+
+    def find_min(self):
+        if self.min == -1:
+            return None
+        return self.Entry(self.name[self.min], self.key[self.min])
+
+    def extract_min(self):
+        z = self.min
+        if z == -1:
+            raise ValueError("Cannot extract minimum: FibArrayHeap is empty.")
+        parent, right = self.parent, self.right
+
+        # Children become roots: clear their parents, then splice in O(1)
+        c = self.child[z]
+        if c != -1:
+            x = c
+            while True:
+                parent[x] = self.NONE
+                x = right[x]
+                if x == c:
+                    break
+            self._splice(z, c)
+            self.child[z] = -1
+
+        if right[z] == z:
+            self.min = -1
+        else:
+            self.min = right[z]
+            self._unlink(z)
+            self._consolidate()
+
+        parent[z] = self.EXTRACTED
+        self.count -= 1
+        return self.Entry(self.name[z], self.key[z])
+
+    def _link(self, y, x):
+        """Make root y a child of root x"""
+        self._unlink(y)
+        c = self.child[x]
+        if c == -1:
+            self.child[x] = y
+        else:
+            self._splice(c, y)
+        self.parent[y] = x
+        self.degree[x] += 1
+        self.mark[y] = 0
+
+    def _consolidate(self):
+        """Link roots of equal degree and find the new minimum"""
+        key, degree, right = self.key, self.degree, self.right
+        table = [-1] * (int(log(self.count) / LOG_PHI) + 2)
+
+        roots = []
+        x = self.min
+        while True:
+            roots.append(x)
+            x = right[x]
+            if x == self.min:
+                break
+
+        for x in roots:
+            d = degree[x]
+            while table[d] != -1:
+                y = table[d]
+                if key[y] < key[x] or (key[y] == key[x] and y == self.min):
+                    x, y = y, x
+                self._link(y, x)
+                table[d] = -1
+                d += 1
+            table[d] = x
+
+        self.min = -1
+        for x in table:
+            if x != -1 and (self.min == -1 or key[x] < key[self.min]):
+                self.min = x
+
+    def _cut(self, x, p):
+        """Move x from the child list of p to the root list"""
+        if self.right[x] == x:
+            self.child[p] = -1
+        else:
+            if self.child[p] == x:
+                self.child[p] = self.right[x]
+            self._unlink(x)
+        self.degree[p] -= 1
+        self._splice(self.min, x)
+        self.parent[x] = self.NONE
+        self.mark[x] = 0
+
+    def decrease_key(self, node: int, k):
+        if not 0 <= node < self.size:
+            raise ValueError(f"{node} is not a slot of this FibArrayHeap")
+        if k >= self.key[node]:
+            raise ValueError("Cannot decrease key with value >= current key")
+        self.key[node] = k
+        p = self.parent[node]
+        if p == self.EXTRACTED:
+            return
+        if p != self.NONE and k < self.key[p]:
+            self._cut(node, p)
+            # Cascading cut up through marked ancestors
+            y = p
+            while True:
+                z = self.parent[y]
+                if z == self.NONE:
+                    break
+                if not self.mark[y]:
+                    self.mark[y] = 1
+                    break
+                self._cut(y, z)
+                y = z
+        if k < self.key[self.min]:
+            self.min = node
+
+    def show(self):
+        if self.min == -1:
+            return
+        x = self.min
+        count = 0
+        while True:
+            print(f"tree{count}\n[")
+            self._print_tree(x)
+            print("]\n")
+            count += 1
+            x = self.right[x]
+            if x == self.min:
+                break
+
+    def _print_tree(self, x):
+        print(f"Key: {self.key[x]}")
+        c = self.child[x]
+        if c != -1:
+            print()
+            y = c
+            while True:
+                self._print_tree(y)
+                y = self.right[y]
+                if y == c:
+                    break
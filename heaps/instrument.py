@@ -0,0 +1,127 @@
+''' Opt-in Heap Operation Counters.
+
+instrument(heap) counts the operations of one heap instance: it shadows the
+instance's insert / insert_many / extract_min / decrease_key and its
+structural helper methods (links, cuts, consolidations, seismic events) with
+counting wrappers, and wraps every key it is given in a float subclass whose
+comparisons are counted. Heaps that are never instrumented keep running the
+plain class methods, so the counters cost nothing when disabled.
+
+Keys stored in typed arrays (heaps with TYPED_KEYS, e.g. FibArrayHeap) lose
+the wrapper, so their comparisons cannot be counted: comparisons is None for
+them and report() writes NA.
+'''
+
+from functools import wraps
+
+# Helper methods counted as structural events, a violation heap 3-way _join
+# counts as one link
+EVENTS = {
+    "links": ("_link", "_heap_link", "_join"),
+    "cuts": ("_cut",),
+    "consolidations": ("_consolidate", "_two_pass", "_multipass"),
+    "seismic_events": ("_seismic_event",),
+}
+
+
+class HeapStats(object):
+    '''Operation counts of an instrumented heap'''
+
+    FIELDS = [
+        "inserts",
+        "extract_mins",
+        "decrease_keys",
+        "comparisons",
+        "links",
+        "cuts",
+        "consolidations",
+        "seismic_events",
+        "peak_size",
+    ]
+
+    def __init__(self):
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return f"HeapStats({self.as_dict()})"
+
+
+def _counting_key(stats):
+    '''float subclass counting its comparisons in stats'''
+
+    def counted(compare):
+        def method(self, other):
+            stats.comparisons += 1
+            return compare(self, other)
+
+        return method
+
+    names = ["__lt__", "__le__", "__gt__", "__ge__", "__eq__", "__ne__"]
+    methods = {name: counted(getattr(float, name)) for name in names}
+    methods["__hash__"] = float.__hash__
+    return type("CountingKey", (float,), methods)
+
+
+def _count_event(stats, event, method):
+    '''Wrap a bound helper method to count event on every call'''
+
+    @wraps(method)
+    def counted(*args, **kwargs):
+        setattr(stats, event, getattr(stats, event) + 1)
+        return method(*args, **kwargs)
+
+    return counted
+
+
+def instrument(heap, stats=None):
+    '''Count the operations of heap from now on, return its HeapStats'''
+    if stats is None:
+        stats = HeapStats()
+    if getattr(heap, "TYPED_KEYS", False):
+        stats.comparisons = None
+        Key = float
+    else:
+        Key = _counting_key(stats)
+    insert, insert_many = heap.insert, heap.insert_many
+    extract_min, decrease_key = heap.extract_min, heap.decrease_key
+
+    def counted_insert(data: dict, name=None):
+        stats.inserts += 1
+        node = insert(dict(data, key=Key(data["key"])), name)
+        stats.peak_size = max(stats.peak_size, len(heap))
+        return node
+
+    def counted_insert_many(items):
+        # The base class fallback goes through counted_insert, count once
+        inserts = stats.inserts
+        nodes = insert_many(
+            (dict(data, key=Key(data["key"])), name) for data, name in items
+        )
+        stats.inserts = inserts + len(nodes)
+        stats.peak_size = max(stats.peak_size, len(heap))
+        return nodes
+
+    def counted_extract_min():
+        stats.extract_mins += 1
+        return extract_min()
+
+    def counted_decrease_key(node, key):
+        stats.decrease_keys += 1
+        return decrease_key(node, Key(key))
+
+    heap.insert = counted_insert
+    heap.insert_many = counted_insert_many
+    heap.extract_min = counted_extract_min
+    heap.decrease_key = counted_decrease_key
+
+    for event, names in EVENTS.items():
+        for name in names:
+            method = getattr(heap, name, None)
+            if method is not None:
+                setattr(heap, name, _count_event(stats, event, method))
+
+    return stats
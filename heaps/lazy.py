@@ -0,0 +1,102 @@
+''' heapq Lazy Deletion Queue Implementation.
+
+Baseline priority queue over the C implemented heapq module. decrease_key
+never moves an entry: it pushes a duplicate (key, seq, node) entry with the
+new key, and extract_min skips entries whose key no longer matches their node
+(a stale duplicate) or whose node has already been extracted. The heap holds
+at most one entry per insert plus one per decrease_key.
+'''
+
+import heapq
+from itertools import count
+
+from heaps.base import Heap
+
+
+class LazyHeap(Heap):
+    '''heapq backed priority queue with lazy deletion'''
+
+    class Node:
+        def __init__(self, data: dict, name=None):
+            self.key = data["key"]
+            self.name = name
+            self.data = data
+            self.extracted = False
+
+    def __init__(self):
+        # (key, seq, node) entries, seq breaks ties so nodes are never compared
+        self.heap = []
+        self.seq = count()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _prune(self):
+        '''Pop stale entries off the top of the heap'''
+        heap = self.heap
+        while heap:
+            key, _, node = heap[0]
+            if not node.extracted and key == node.key:
+                return
+            heapq.heappop(heap)
+
+    def insert(self, data: dict, name=None):
+        node = self.Node(data, name)
+        heapq.heappush(self.heap, (node.key, next(self.seq), node))
+        self.count += 1
+        return node
+
+    def _extend(self, nodes):
+        '''push an entry per node, heapifying when there are at least as many
+        as entries in the heap'''
+        entries = [(node.key, next(self.seq), node) for node in nodes]
+        if len(entries) >= len(self.heap):
+            self.heap.extend(entries)
+            heapq.heapify(self.heap)
+        else:
+            for entry in entries:
+                heapq.heappush(self.heap, entry)
+        self.count += len(nodes)
+
+    def insert_many(self, items):
+        nodes = [self.Node(data, name) for data, name in items]
+        self._extend(nodes)
+        return nodes
+
+    def meld(self, other):
+        '''move the live nodes of other into this heap, dropping its stale
+        entries, and leave other empty'''
+        entries, other.heap = other.heap, []
+        other.count = 0
+        live = [node for key, _, node in entries if key == node.key]
+        self._extend([node for node in live if not node.extracted])
+
+    def find_min(self):
+        self._prune()
+        return self.heap[0][2] if self.heap else None
+
+    def extract_min(self):
+        self._prune()
+        if not self.heap:
+            raise ValueError("Cannot extract minimum: LazyHeap is empty.")
+        node = heapq.heappop(self.heap)[2]
+        node.extracted = True
+        self.count -= 1
+        return node
+
+    def decrease_key(self, node, key):
+        if key >= node.key:
+            raise ValueError("Cannot decrease key with value >= current key")
+        node.key = key
+        if not node.extracted:
+            heapq.heappush(self.heap, (key, next(self.seq), node))
+
+    def show(self):
+        print(
+            sorted(
+                key
+                for key, _, node in self.heap
+                if not node.extracted and key == node.key
+            )
+        )
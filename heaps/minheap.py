@@ -2,75 +2,116 @@ from heaps.base import Heap
 
 
 class MinHeap(Heap):
-    """vanilla min-heap priority queue"""
+    """vanilla min-heap priority queue
+
+    Indexed binary heap: every node stores its position in the heap array, so
+    decrease_key can sift it up in O(log n) without searching for it.
+    """
 
     class Node:
         def __init__(self, data: dict, name=None):
             self.key = data["key"]
             self.name = name
             self.data = data
+            # Index into MinHeap.heap, None once extracted
+            self.pos = None
 
-    heap = []
+    def __init__(self):
+        self.heap = []
 
-    def _upheap(self, pos=None):
+    def _upheap(self, pos):
         """up-heap element at given pos in heap array"""
-        child = pos or len(self.heap) - 1
-        parent = (child - 1) // 2
-
-        while child and self.heap[child].key < self.heap[parent].key:
-            self.heap[child], self.heap[parent] = self.heap[parent], self.heap[child]
-            child = parent
-            parent = (child - 1) // 2
+        heap = self.heap
+        node = heap[pos]
+        while pos:
+            parent = (pos - 1) >> 1
+            if not node.key < heap[parent].key:
+                break
+            heap[pos] = heap[parent]
+            heap[pos].pos = pos
+            pos = parent
+        heap[pos] = node
+        node.pos = pos
 
-    def _downheap(self):
-        """downheap element"""
-        if len(self.heap) < 2:
-            return
-
-        item = 0
-        while (2 * item + 1) < len(self.heap):
-            child = 2 * item + 1
-            if (2 * item + 2) < len(self.heap) and self.heap[
-                2 * item + 2
-            ].key < self.heap[2 * item + 1].key:
-                child = 2 * item + 2
-            if self.heap[child].key > self.heap[item].key:
-                return
-            self.heap[child], self.heap[item] = self.heap[item], self.heap[child]
-            item = child
+    def _downheap(self, pos=0):
+        """down-heap element at given pos in heap array"""
+        heap = self.heap
+        size = len(heap)
+        node = heap[pos]
+        child = 2 * pos + 1
+        while child < size:
+            if child + 1 < size and heap[child + 1].key < heap[child].key:
+                child += 1
+            if not heap[child].key < node.key:
+                break
+            heap[pos] = heap[child]
+            heap[pos].pos = pos
+            pos = child
+            child = 2 * pos + 1
+        heap[pos] = node
+        node.pos = pos
 
     def insert(self, data: dict, name=None):
         node = self.Node(data, name)
         self.heap.append(node)
-        self._upheap()
+        self._upheap(len(self.heap) - 1)
         return node
 
+    def _extend(self, nodes):
+        """add nodes, heapifying bottom-up in O(n) when there are at least as
+        many as in the heap"""
+        heap = self.heap
+        if len(nodes) < len(heap):
+            for node in nodes:
+                heap.append(node)
+                self._upheap(len(heap) - 1)
+            return
+
+        heap.extend(nodes)
+        for pos, node in enumerate(heap):
+            node.pos = pos
+        for pos in range((len(heap) >> 1) - 1, -1, -1):
+            self._downheap(pos)
+
+    def insert_many(self, items):
+        """insert (data, name) pairs, return their nodes in order"""
+        nodes = [self.Node(data, name) for data, name in items]
+        self._extend(nodes)
+        return nodes
+
+    def meld(self, other):
+        """move the nodes of other into this heap, leaving other empty"""
+        nodes, other.heap = other.heap, []
+        self._extend(nodes)
+
     def find_min(self):
         if not self.heap:
             return None
-        # TODO: Why heap[1] instead of heap[0]?
-        return self.heap[1]
+        return self.heap[0]
 
     def extract_min(self) -> Node:
         """delete minimum element"""
         if not self.heap:
             return None
 
-        self.heap[0], self.heap[-1] = self.heap[-1], self.heap[0]
-        data = self.heap.pop()
-        self._downheap()
-        return data
+        heap = self.heap
+        smallest = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._downheap(0)
+        smallest.pos = None
+        return smallest
 
     def decrease_key(self, node: Node, key):
         if key >= node.key:
             raise ValueError("Cannot decrease key with value >= current key")
-        if node in self.heap:  # TODO: remove O(n) search
-            pos = self.heap.index(node)
-            self.heap[pos].key = key
-            self._upheap(pos)
+        if node.pos is not None:
+            node.key = key
+            self._upheap(node.pos)
 
     def show(self):
-        print(self.heap)
+        print([node.key for node in self.heap])
 
     def __len__(self):
         return len(self.heap)
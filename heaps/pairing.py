@@ -0,0 +1,163 @@
+''' Pairing Heap Implementation.
+
+Heap-ordered multiway tree stored as child / sibling pointers. insert and
+decrease_key are a single link with the root; extract_min links the root's
+children back into one tree, either with the standard two-pass rule (pair up
+left to right, then fold right to left) or with multipass (keep pairing trees
+from a FIFO queue until one is left).
+
+References:
+Fredman, Sedgewick, Sleator, Tarjan - The pairing heap: a new form of
+self-adjusting heap (1986)
+'''
+
+from collections import deque
+
+from heaps.base import Heap
+
+
+class PairingHeap(Heap):
+    '''Pairing heap priority queue'''
+
+    class Node:
+        def __init__(self, data: dict, name=None):
+            self.key = data["key"]
+            self.name = name
+            self.data = data
+            self.child = None
+            # Next sibling, and previous sibling or parent for a first child
+            self.next = None
+            self.prev = None
+
+    def __init__(self, multipass=False):
+        self.multipass = multipass
+        self.root = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _link(self, a: Node, b: Node) -> Node:
+        '''Make the root with the larger key the first child of the other'''
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.next = a.child
+        if a.child is not None:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    def _two_pass(self, trees):
+        '''Pair left to right, then fold the pairs right to left'''
+        link = self._link
+        pairs = [link(trees[i], trees[i + 1]) for i in range(0, len(trees) - 1, 2)]
+        root = trees[-1] if len(trees) % 2 else pairs.pop()
+        while pairs:
+            root = self._link(pairs.pop(), root)
+        return root
+
+    def _multipass(self, trees):
+        '''Link the first two trees of a FIFO queue until one is left'''
+        queue = deque(trees)
+        while len(queue) > 1:
+            queue.append(self._link(queue.popleft(), queue.popleft()))
+        return queue[0]
+
+    def insert(self, data: dict, name=None):
+        node = self.Node(data, name)
+        self.root = node if self.root is None else self._link(self.root, node)
+        self.count += 1
+        return node
+
+    def insert_many(self, items):
+        '''Hang the batch as children of its smallest node, then link once'''
+        nodes = [self.Node(data, name) for data, name in items]
+        if not nodes:
+            return nodes
+        smallest = nodes[0]
+        for node in nodes:
+            if node.key < smallest.key:
+                smallest = node
+        prev = smallest
+        for node in nodes:
+            if node is not smallest:
+                node.prev = prev
+                if prev is smallest:
+                    smallest.child = node
+                else:
+                    prev.next = node
+                prev = node
+        self.root = smallest if self.root is None else self._link(self.root, smallest)
+        self.count += len(nodes)
+        return nodes
+
+    def meld(self, other):
+        '''Link the root of other with this root in O(1), other is left empty'''
+        if other.root is not None:
+            self.root = (
+                other.root if self.root is None else self._link(self.root, other.root)
+            )
+        self.count += other.count
+        other.root = None
+        other.count = 0
+
+    def find_min(self):
+        return self.root
+
+    def extract_min(self) -> Node:
+        smallest = self.root
+        if smallest is None:
+            raise ValueError("Cannot extract minimum: PairingHeap is empty.")
+
+        trees = []
+        child = smallest.child
+        while child is not None:
+            next = child.next
+            child.prev = child.next = None
+            trees.append(child)
+            child = next
+        smallest.child = None
+
+        if not trees:
+            self.root = None
+        elif self.multipass:
+            self.root = self._multipass(trees)
+        else:
+            self.root = self._two_pass(trees)
+        self.count -= 1
+        return smallest
+
+    def decrease_key(self, node: Node, key):
+        if key >= node.key:
+            raise ValueError("Cannot decrease key with value >= current key")
+        node.key = key
+        if node is self.root or node.prev is None:
+            # The root, or already extracted
+            return
+
+        self._cut(node)
+        self.root = self._link(self.root, node)
+
+    def _cut(self, node: Node):
+        '''Detach the subtree rooted at node from its parent and siblings'''
+        if node.prev.child is node:
+            node.prev.child = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def show(self):
+        '''Print each tree level with its parent's key'''
+        level = [(self.root, None)] if self.root else []
+        while level:
+            print([(node.key, parent) for node, parent in level])
+            next_level = []
+            for node, _ in level:
+                child = node.child
+                while child is not None:
+                    next_level.append((child, node.key))
+                    child = child.next
+            level = next_level
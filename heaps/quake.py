@@ -1,11 +1,13 @@
 '''
 Python Implementation of Quake Heap utilizing insertion of NetworkX nodes.
 Implented by: Camden Kronhaus
+
+References:
+Chan - Quake Heaps: A Simple Alternative to Fibonacci Heaps (2013)
 '''
 import sys
 sys.path.append("..")
 from heaps.base import Heap
-import math
 
 
 class TournamentTree:
@@ -14,156 +16,150 @@ class TournamentTree:
     '''
     class Clone:
         '''
-        All nodes are clones, but the bottom level is made of the "true vertex." This vertex maintins information such as the key, the highest clone and its level, and the
-        inserted data and name of the data. All other clones point to this vertex to retrieve the key or other data. This way, during a decrease key operation, all clones are
-        "updated" immediately, as they have no keys themselves, only the vertex key. Vertices are marked by the isvertex field.
+        All nodes are clones, but the bottom level is made of the "true vertex." This vertex maintins information such as the key, the highest clone,
+        and the inserted data and name of the data. All other clones point to this vertex to retrieve the key or other data. This way, during a decrease key operation, all clones are
+        "updated" immediately, as they have no keys themselves, only the vertex key. A clone is a vertex when its vertex field points to itself.
         '''
 
-        def __init__(self, data: dict = None, name=None, isvertex=False):
-            if(isvertex):
+        def __init__(self, data: dict = None, name=None, vertex=None, height=0):
+            if vertex is None:
+                vertex = self
                 self.key = data["key"]
+                # None once the vertex has been extracted
                 self.highestclone = self
-                self.highestclonelevel = 0
                 self.data = data
                 self.name = name
-            self.vertex = self
+            self.vertex = vertex
+            self.height = height
             self.left = self.right = self.parent = None
-            self.isvertex = isvertex
 
         def __repr__(self):
             return f'{self.vertex.name, self.vertex.key}'
 
-    def __init__(self, node: Clone):
-        self.root = node
-        self.height = node.vertex.highestclonelevel
-
-    def __repr__(self):
-        return f'{self.root}'
-
 
 class QuakeHeap(Heap):
     def __init__(self):
-        # Invariant used for seismic operation. 
-        self.alpha = 3/4  
+        # Invariant used for seismic operation.
+        self.alpha = 3/4
         '''
-        2d list of trees, outer index corresponds to height of trees
-        inner lists are list of TournamentTrees.
+        Roots of the trees, outer index corresponds to height of trees.
+        Each level is a dict used as an insertion ordered set of root clones,
+        so a tree is added or removed in O(1).
         '''
-        self.trees = []
-        self.trees.append([])
-        # Pointer to tree with minimum root
-        self.min = None  
-        # Number of vertices on each level, index is level
-        self.numv = [] 
-        self.numv.append(0)
+        self.trees = [{}]
+        # Root clone of the tree with minimum vertex
+        self.min = None
+        # Number of nodes on each level, index is level
+        self.numv = [0]
 
     def __len__(self):
         return self.numv[0]
-    
+
     '''
     Insert a new element, creating new tree, update min root
     '''
 
     def insert(self, data: dict, name=None):
-        new_node = TournamentTree.Clone(data, name, isvertex=True)
-        # Create a new tree when inserting
-        t = TournamentTree(new_node)  
+        new_node = TournamentTree.Clone(data, name)
         # append new tree to level 0
-        self.trees[0].append(t)  
-        # if there is no min node, or inserted key is less than min node, update min node
-        if(self.min == 0):
-            self.show()
-            print (self.min)
-        
-        if (self.min is None or data["key"] < self.min.vertex.key):
-            self.min = t.root
-        # increment number of nodes at lowest level
-        self.numv[0] += 1  
-        # we need to maintain a length of the maximum number of nodes
-        while(len(self.numv) < math.log(self.numv[0], (1/self.alpha))):
-            self.numv.append(0)
+        self.trees[0][new_node] = None
+        self.numv[0] += 1
+        if (self.min is None or new_node.key < self.min.vertex.key):
+            self.min = new_node
 
         return new_node
 
-    '''Add a tree to the internal list of trees'''
-
-    def _append_tree(self, tree):
-        while(len(self.trees) <= tree.height):
-            self.trees.append([])
-        self.trees[tree.height].append(tree)
-
     '''
-    Compares two Clones, and returns the minimum
+    Insert (data, name) pairs as singleton trees in one pass, return their vertices
     '''
 
-    def _give_min(self, node1: TournamentTree.Clone, node2: TournamentTree.Clone):
-        if(node1.vertex.key <= node2.vertex.key):
-            return node1
-        else:
-            return node2
+    def insert_many(self, items):
+        nodes = [TournamentTree.Clone(data, name) for data, name in items]
+        self.trees[0].update(dict.fromkeys(nodes))
+        for node in nodes:
+            if (self.min is None or node.key < self.min.vertex.key):
+                self.min = node
+        self.numv[0] += len(nodes)
+
+        return nodes
 
     '''
-    Link two trees during a "recursive" merge. Assumes equal height trees
+    Move the trees of other into this heap in O(number of trees), leaving other empty.
+    Trees of equal height are linked by the next extract_min.
     '''
 
-    def _link(self, tree1: TournamentTree, tree2: TournamentTree):
-        # Clone min of two roots, to become a new tree root
-        minroot = self._give_min(tree1.root, tree2.root)
-        newroot = TournamentTree.Clone()
-        newroot.vertex = minroot.vertex
+    def meld(self, other):
+        for level in other.trees:
+            for root in level:
+                self._append_tree(root)
+        for height, n in enumerate(other.numv):
+            if(len(self.numv) <= height):
+                self.numv.append(0)
+            self.numv[height] += n
+        if (other.min is not None and (self.min is None or other.min.vertex.key < self.min.vertex.key)):
+            self.min = other.min
+        other.trees = [{}]
+        other.min = None
+        other.numv = [0]
+
+    '''Add a tree root to the level of its height'''
+
+    def _append_tree(self, root: TournamentTree.Clone):
+        while(len(self.trees) <= root.height):
+            self.trees.append({})
+        self.trees[root.height][root] = None
 
-        # Create a new tree with root being a clone of the minimum root of subtrees
-        t = TournamentTree(newroot)
-        t.root.left = tree1.root
-        t.root.right = tree2.root
-        t.height = tree1.height + 1
-        t.root.vertex = minroot.vertex
+    '''
+    Link two trees of equal height under a clone of the smaller root, return the new root
+    '''
 
-        tree1.root.parent = t.root
-        tree2.root.parent = t.root
-        minroot.vertex.highestclone = newroot
-        minroot.vertex.highestclonelevel += 1
+    def _link(self, root1: TournamentTree.Clone, root2: TournamentTree.Clone):
+        if(root2.vertex.key < root1.vertex.key):
+            root1, root2 = root2, root1
+        newroot = TournamentTree.Clone(vertex=root1.vertex, height=root1.height + 1)
+        newroot.left = root1
+        newroot.right = root2
+        root1.parent = root2.parent = newroot
+        root1.vertex.highestclone = newroot
 
         # Update level count
-        self.numv[t.height] += 1
-        if (self.min is None or newroot.vertex.key < self.min.vertex.key):
-            self.min = t.root
-        # Add to list of trees
-        self._append_tree(t)
+        if(len(self.numv) <= newroot.height):
+            self.numv.append(0)
+        self.numv[newroot.height] += 1
+        return newroot
 
     '''
-    Perform merging on trees with the same height
+    Link trees of equal height from the bottom level up, leaving at most one
+    tree per height, then find the new min among those O(log n) roots
     '''
 
-    def _merge(self):
-        a = 0
-        curr_min = float('inf')
-
-        for L in self.trees:
-            # Search for new min node among trees
-            for l in L:
-                if(self.min != float('inf')):
-                    if (l.root.vertex.key <= curr_min):
-                        self.min = l.root
-                        curr_min = self.min.vertex.key
-                # Link as long as there are two trees with the same height
-                # Min will make it's way to the top anyway so above is safe
-            while (len(L) >= 2):
-                self._link(L[0], L[1])
-                L.pop(0)
-                L.pop(0)
+    def _consolidate(self):
+        h = 0
+        while(h < len(self.trees)):
+            level = self.trees[h]
+            while(len(level) >= 2):
+                root1, _ = level.popitem()
+                root2, _ = level.popitem()
+                self._append_tree(self._link(root1, root2))
+            h += 1
+
+        self.min = None
+        for level in self.trees:
+            for root in level:
+                if (self.min is None or root.vertex.key < self.min.vertex.key):
+                    self.min = root
 
     '''Cut a node from its parent'''
 
     def _cut(self, node: TournamentTree.Clone):
         '''
         If highest vertex is root do nothing.
-        Otherwise we need to check where we need to cut from (whether it is a left or right child) 
+        Otherwise we need to check where we need to cut from (whether it is a left or right child)
         and set parent's child to none
         '''
         if(node.parent is None):
             return
-        if(node.parent.left == node):
+        if(node.parent.left is node):
             node.parent.left = None
         else:
             node.parent.right = None
@@ -179,144 +175,83 @@ class QuakeHeap(Heap):
         # Update value of vertex, updating all clones by default
         node.key = value
 
-        '''
-        If the highest clone is a root (no parents) update min if necessary
-        then do not cut and return
-        '''
-        if(node.vertex.highestclone.parent == None):
-            if(self.min == None or node.vertex.highestclone.vertex.key < self.min.vertex.key):
-                self.min = node.vertex.highestclone
+        top = node.highestclone
+        if(top is None):
+            # Already extracted
             return
 
-        # Cut highest clone and decsendents of decreased key and create a new tree from node
-        self._cut(node.vertex.highestclone)
-        newtree = TournamentTree(node.vertex.highestclone)
-        self._append_tree(newtree)
+        # Cut highest clone and descendents of decreased key and create a new tree from it
+        if(top.parent is not None):
+            self._cut(top)
+            self._append_tree(top)
         # Update min
-        if (self.min is None or node.vertex.key < self.min.vertex.key):
-            self.min = newtree.root
+        if (value < self.min.vertex.key):
+            self.min = top
 
     '''Removes the min vertex in heap and returns it'''
 
     def extract_min(self):
-        # Walk up from vertex, cutting itself from parents
-        quake_needed = False
-        quake_level = 0
-        curr = self.min.vertex
-        min_node = self.min.vertex
-        # Heightcount keeps track of current tree level as we walk up
-        heightcount = 0
-
-        # If the min node is a lone vertex (no parents), simply find and remove, O(n)
-        if (curr.parent is None):
-            for t in self.trees[self.min.vertex.highestclonelevel]:
-                if (t.root == curr):
-                    self.trees[self.min.vertex.highestclonelevel].remove(t)
-                    self.numv[t.height] -= 1
-        else:
-            # Start cutting up. Highest clone should always be root in extract_min.
-            while(curr.vertex.highestclone is not curr):
-                addnode = None
-
-                # Every level passed is a level that will be have one less node
-                self.numv[heightcount] -= 1
-                '''
-                #!check for seismic operation
-                N(i+1) must be less than or equal to alpha * N(i)
-                '''
-                if((heightcount+1 < len(self.numv)) and (self.numv[heightcount] != 0) and (self.numv[heightcount+1]/self.numv[heightcount] > self.alpha)):
-                    quake_needed = True
-                    quake_level = heightcount+1
-
-                '''
-                Cut as we go, checking which side the vertex came from, adding other side to a new tree.
-                Addnode keeps track of node on the other side.
-                If current clone is on the left, add right not if there is one.
-                '''
-                if(curr.parent.left is not None and curr.parent.left.vertex == curr.vertex):
-                    if(curr.parent.right is not None):
-                        addnode = curr.parent.right
-                        self._cut(curr.parent.right)
-                        curr.right = None
+        if(self.min is None):
+            raise ValueError("Cannot extract minimum: QuakeHeap is empty.")
+        root = self.min
+        min_node = root.vertex
+        del self.trees[root.height][root]
+
+        '''
+        Walk down the path of clones of the min vertex, deleting each. At every level
+        the child representing another vertex becomes the root of a new tree.
+        '''
+        curr = root
+        while(curr is not None):
+            self.numv[curr.height] -= 1
+            nextnode = None
+            for child in (curr.left, curr.right):
+                if(child is None):
+                    continue
+                child.parent = None
+                if(child.vertex is min_node):
+                    nextnode = child
                 else:
-                    if(curr.parent.left is not None):
-                        addnode = curr.parent.left
-                        self._cut(curr.parent.left)
-                        curr.left = None
-                if(addnode is not None):
-                    # Add addnode to tree list
-                    n = TournamentTree(addnode)
-                    n.height = addnode.vertex.highestclonelevel
-                    self._append_tree(n)
-
-                # Go up a level
-                curr = curr.parent
-                heightcount += 1
-
-            # Now at the root, remove from tree list, add other child
-            for t in self.trees[self.min.vertex.highestclonelevel]:
-                if (t.root == curr):
-                    self.trees[self.min.vertex.highestclonelevel].remove(t)
-                    self.numv[t.height] -= 1
-                    break
-
-        # Recursive _merge trees of same height
-        self._merge()
-
-        if(quake_needed):
-            self._seismic_event(quake_level)
+                    self._append_tree(child)
+            curr.left = curr.right = None
+            curr = nextnode
+        min_node.highestclone = None
 
-        return min_node
+        # Link trees of same height, finding the new min
+        self._consolidate()
 
-    '''Performs DFS during quake operation, removing all the nodes at level "level" and above.
-        Takes a currentheight of the tree, and traverses down to the left and right attempting to reach the target level.
-        If target level is reached, disconnect above nodes, add subtrees to tree list.'''
+        '''
+        #!check for seismic operation
+        N(i+1) must be less than or equal to alpha * N(i)
+        '''
+        for i in range(len(self.numv) - 1):
+            if(self.numv[i + 1] > self.alpha * self.numv[i]):
+                self._seismic_event(i)
+                break
 
-    def _dfs_delete(self, currheight, targetlevel, node):
-        if(node == None):
-            return
-        # Decrement if successful traversal down a node a level, we will be deleting the previous levels
-        self.numv[currheight] -= 1
-        if(currheight == targetlevel):
-            if(node.left is not None):
-                node.left.parent = None
-                addnode = node.left
-                # Add to tree list
-                n = TournamentTree(addnode)
-                n.height = currheight-1
-                n.root.vertex.highestclonelevel = n.height
-                n.root.vertex.highestclone = n.root
-                self._append_tree(n)
-            if(node.right is not None):
-                node.right.parent = None
-                addnode = node.right
-                # Add to tree list
-                n = TournamentTree(addnode)
-                n.height = currheight-1
-                n.root.vertex.highestclonelevel = n.height
-                n.root.vertex.highestclone = n.root
-                self._append_tree(n)
-
-            node.left = None
-            node.right = None
-        else:
-            self._dfs_delete(currheight-1, targetlevel, node.left)
-            self._dfs_delete(currheight-1, targetlevel, node.right)
+        return min_node
 
-    '''Perform quake operation'''
+    '''Perform quake operation, removing every node above level.
+        The nodes at level are disconnected from their parents and become the roots of new trees.'''
 
     def _seismic_event(self, level):
-        '''
-        Height of tree must be at least equal to level
-        loop through trees, with at least that level
-        '''
-        for i in range(level, len(self.trees)):
-            for tree in self.trees[i]:
-                self._dfs_delete(i, level, tree.root)
-                # within DFS Delete we create new trees, delete the original tree from list
-                self.trees[i].remove(tree)
-        # We find a new min here
-        self._merge()
+        for h in range(level + 1, len(self.trees)):
+            stack = list(self.trees[h])
+            while(stack):
+                node = stack.pop()
+                if(node.height == level):
+                    node.parent = None
+                    node.vertex.highestclone = node
+                    self._append_tree(node)
+                    continue
+                for child in (node.left, node.right):
+                    if(child is not None):
+                        stack.append(child)
+                node.left = node.right = None
+        del self.trees[level + 1:]
+        del self.numv[level + 1:]
+        # The min vertex is unchanged, its highest clone is now at or below level
+        self.min = self.min.vertex.highestclone
 
     '''Return the minimum vertex in the heap'''
 
@@ -328,8 +263,8 @@ class QuakeHeap(Heap):
     def show(self):
         for i in range(0, len(self.trees)):
             print("Height", i, ": ")
-            for L in self.trees[i]:
-                self._print_tree(L.root)
+            for root in self.trees[i]:
+                self._print_tree(root)
                 print("-------------------------------")
     '''
     Called by show method to print tree
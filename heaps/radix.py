@@ -0,0 +1,138 @@
+''' Radix Heap Implementation.
+
+Monotone priority queue for non-negative integer keys: every key inserted or
+decreased to must be >= the last extracted key, which always holds for
+Dijkstra's algorithm. Bucket i holds the nodes whose key first differs from
+the last extracted key in bit i - 1, so an extract_min only redistributes one
+bucket into lower ones and every node moves down at most log(C) times.
+
+References:
+https://en.wikipedia.org/wiki/Radix_heap
+Ahuja, Mehlhorn, Orlin, Tarjan - Faster algorithms for the shortest path problem
+'''
+
+from heaps.base import Heap
+
+
+class RadixHeap(Heap):
+    '''Radix heap priority queue'''
+
+    class Node:
+        def __init__(self, data: dict, name=None):
+            self.key = data["key"]
+            self.name = name
+            self.data = data
+            # Bucket list holding the node and its index there, None once extracted
+            self.bucket = None
+            self.pos = None
+
+    def __init__(self):
+        self.last = 0
+        self.buckets = [[]]
+        # Nodes with key inf until their key is decreased
+        self.infinite = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _place(self, node):
+        '''Append node to the bucket matching its key'''
+        key = node.key
+        if key == float("inf"):
+            bucket = self.infinite
+        else:
+            if key != int(key):
+                raise ValueError("RadixHeap keys must be integers")
+            if key < self.last:
+                raise ValueError("RadixHeap keys must be >= the last extracted key")
+            i = (int(key) ^ self.last).bit_length()
+            while len(self.buckets) <= i:
+                self.buckets.append([])
+            bucket = self.buckets[i]
+        node.bucket = bucket
+        node.pos = len(bucket)
+        bucket.append(node)
+
+    def _remove(self, node):
+        '''Swap-remove node from its bucket in O(1)'''
+        bucket = node.bucket
+        last = bucket.pop()
+        if last is not node:
+            bucket[node.pos] = last
+            last.pos = node.pos
+        node.bucket = node.pos = None
+
+    def _refill(self):
+        '''Make bucket 0 non-empty by redistributing the first non-empty bucket'''
+        buckets = self.buckets
+        if buckets[0]:
+            return True
+        for i in range(1, len(buckets)):
+            if buckets[i]:
+                break
+        else:
+            return False
+
+        bucket = buckets[i]
+        buckets[i] = []
+        self.last = int(min(node.key for node in bucket))
+        for node in bucket:
+            self._place(node)
+        return True
+
+    def insert(self, data: dict, name=None):
+        node = self.Node(data, name)
+        self._place(node)
+        self.count += 1
+        return node
+
+    def meld(self, other):
+        '''Move the nodes of other into this heap, leaving other empty
+
+        If other has extracted less far, the cursor moves back to its last key
+        and every node of this heap is re-placed as well.
+        '''
+        nodes = [node for bucket in other.buckets for node in bucket]
+        nodes += other.infinite
+        if nodes and other.last < self.last:
+            nodes += [node for bucket in self.buckets for node in bucket]
+            nodes += self.infinite
+            self.buckets, self.infinite = [[]], []
+            self.last = other.last
+        for node in nodes:
+            self._place(node)
+        self.count += other.count
+        other.buckets, other.infinite = [[]], []
+        other.count = 0
+
+    def find_min(self):
+        if self._refill():
+            return self.buckets[0][-1]
+        return self.infinite[-1] if self.infinite else None
+
+    def extract_min(self):
+        if self.count == 0:
+            raise ValueError("Cannot extract minimum: RadixHeap is empty.")
+        node = self.find_min()
+        self._remove(node)
+        self.count -= 1
+        return node
+
+    def decrease_key(self, node, key):
+        if key >= node.key:
+            raise ValueError("Cannot decrease key with value >= current key")
+        if key < self.last:
+            raise ValueError("RadixHeap keys must be >= the last extracted key")
+        if node.bucket is None:
+            return
+        self._remove(node)
+        node.key = key
+        self._place(node)
+
+    def show(self):
+        for i, bucket in enumerate(self.buckets):
+            if bucket:
+                print(f"bucket {i}: {[node.key for node in bucket]}")
+        if self.infinite:
+            print(f"inf: {len(self.infinite)} nodes")
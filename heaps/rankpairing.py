@@ -1,17 +1,20 @@
-from math import log
-
-# from heaps.base import Heap
-from collections import defaultdict
+from heaps.base import Heap
 
 
 """
-Sources: 
+Sources:
 https://www.cs.princeton.edu/courses/archive/spr10/cos423/handouts/rankpairingheaps.pdf
 """
 
 
-class RankPairingHeap(object):
-    """Rank-Pairing Heap Implementation based on Tarjan's paper"""
+class RankPairingHeap(Heap):
+    """Rank-Pairing Heap Implementation based on Tarjan's paper
+
+    Half-trees hang off a circular root list; a half-tree root only has a left
+    child. extract_min does a single one-pass linking of equal rank roots, and
+    decrease_key cuts the node out as a new half-tree and repairs the ranks
+    above it with the type-1 or type-2 rank rule.
+    """
 
     class HalfTree(object):
         """HalfTree class for internal nodes"""
@@ -33,46 +36,53 @@ class RankPairingHeap(object):
             s += f"|{self.next.name:^9}" if self.next else f'|{"-":^9}'
             return s
 
-    def __init__(self):
-        """initialize empty heap"""
+    def __init__(self, rank_type=1):
+        """initialize empty heap, rank_type selects the type-1 or type-2 rule"""
+        if rank_type not in (1, 2):
+            raise ValueError("rank_type must be 1 or 2")
+        self.rank_type = rank_type
         self.min = None
         self.count = 0
 
+    def _add_root(self, node):
+        """add half-tree to root-list after min and update min"""
+        if self.min is None:
+            self.min = node.next = node.prev = node
+            return
+        node.prev, node.next = self.min, self.min.next
+        node.prev.next = node.next.prev = node
+        if node.key < self.min.key:
+            self.min = node
+
     def insert(self, data: dict, name=None):
         """add singleton to root-list"""
         node = RankPairingHeap.HalfTree(data, name)
-
-        if self.count == 0:
-            self.min = node.next = node.prev = node
-
-        elif self.count == 1:
-            self.min.next, self.min.prev, node.next, node.prev = (
-                node,
-                node,
-                self.min,
-                self.min,
-            )
-            self.min = node if self.min.key > node.key else self.min
-
-        else:
-            # always insert in 'first' position
-            node.prev, node.next = self.min.prev, self.min
-            node.prev.next, node.next.prev = node, node
-
-            # update min-root
-            if self.min.key > node.key:
-                self.min = node
-
+        self._add_root(node)
         self.count += 1
         return node
 
-    def debug_check_loop(self, node=None):
-        node, seen = self.min.next, []
-        while node != self.min:
-            if node in seen:
-                self.show(verbose=True, node=node)
-            seen.append(node)
-            node = node.next
+    def insert_many(self, items):
+        """add singletons to root-list as one spliced ring"""
+        nodes = [RankPairingHeap.HalfTree(data, name) for data, name in items]
+        if not nodes:
+            return nodes
+        smallest = nodes[0]
+        prev = nodes[-1]
+        for node in nodes:
+            node.prev, prev.next = prev, node
+            prev = node
+            if node.key < smallest.key:
+                smallest = node
+        if self.min is None:
+            self.min = smallest
+        else:
+            first, last = nodes[0], nodes[-1]
+            last.next, self.min.next.prev = self.min.next, last
+            self.min.next, first.prev = first, self.min
+            if smallest.key < self.min.key:
+                self.min = smallest
+        self.count += len(nodes)
+        return nodes
 
     def _show_bfs(self, root):
         """traverse half-tree using breadth first search"""
@@ -93,7 +103,7 @@ class RankPairingHeap(object):
 
         print("-" * 80)
 
-    def show(self, verbose=False, node=None):
+    def show(self, verbose=False):
         """debug print utility - verbose prints all half trees"""
         if self.count == 0:
             raise ValueError("RankPairingHeap empty")
@@ -103,16 +113,12 @@ class RankPairingHeap(object):
                 f'{"id":^7}|{"key":^7}|{"rank":^7}||{"parent":^9}|{"left":^9}|{"right":^9}||{"prev":^9}|{"next":^9}\n'
                 + "-" * 80
             )
-            self._show_bfs(self.min)
-            node, seen = self.min.next, []
-            while node != self.min:
+            node = self.min
+            while True:
                 self._show_bfs(node)
-                if node.name in seen:
-                    raise RuntimeError(
-                        f"\nCall caused min to be skipped:\n{self.min}\n"
-                    )
-                seen.append(node.name)
                 node = node.next
+                if node == self.min:
+                    break
         else:
             node = self.min.next
             while node != self.min:
@@ -121,11 +127,12 @@ class RankPairingHeap(object):
 
         print(f"[min-key={self.min.key}, count={self.count}]\n")
 
-    def merge(self, heap):
-        """merge root lists and update minimum"""
+    def meld(self, heap):
+        """merge root lists in O(1) and update minimum, heap is left empty"""
         if not self.min or not heap.min:
             self.min = self.min or heap.min
-            self.count = max(self.count, heap.count)
+            self.count += heap.count
+            heap.min, heap.count = None, 0
             return
 
         """ concatenate DLL of roots """
@@ -137,6 +144,9 @@ class RankPairingHeap(object):
             self.min = heap.min
 
         self.count += heap.count
+        heap.min, heap.count = None, 0
+
+    merge = meld
 
     def find_min(self):
         """return minimum key"""
@@ -144,41 +154,26 @@ class RankPairingHeap(object):
             raise ValueError("Cannot find_min: RankPairingHeap is empty")
         return self.min
 
-    def _compress(self):
-        """merge roots of equal rank until no two roots have equal rank"""
-
-        rankdict = defaultdict(lambda: [])
-
-        node = self.min.next
-        if node == self.min:
-            return
-
-        while node != self.min:
-            rankdict[node.rank].append(node)
-            node = node.next
-
-        """ recursively merge in pairs - update minimum """
-        for rank in range(int(log(self.count, 2)) + 1):
-            mergelist = rankdict[rank]
-
-            for _ in range(0, len(mergelist) - 1, 2):
-                lg, sm = mergelist.pop(), mergelist.pop()
-
-                if lg.key < sm.key:
-                    sm, lg = lg, sm
-
-                sm.left, lg.right, lg.parent = lg, sm.left, sm
-                if lg.right:
-                    lg.right.parent = lg
-                lg.prev.next = lg.next
-                lg.next.prev = lg.prev
-                lg.next = lg.prev = None
-                sm.rank += 1
-
-                rankdict[sm.rank].append(sm)
-
-                if sm.key < self.min.key:
-                    self.min = sm
+    def _link(self, x, y):
+        """link two equal rank half-trees, the loser becomes the winner's left child"""
+        if y.key < x.key:
+            x, y = y, x
+        y.right = x.left
+        if y.right:
+            y.right.parent = y
+        x.left, y.parent = y, x
+        x.rank = y.rank + 1
+        return x
+
+    def _rank(self, node):
+        """rank of node from its children under the heap's rank rule"""
+        left = node.left.rank if node.left else -1
+        if node.parent is None:  # root
+            return left + 1
+        right = node.right.rank if node.right else -1
+        if self.rank_type == 1:
+            return left + 1 if left == right else max(left, right)
+        return max(left, right) + 1 if abs(left - right) <= 1 else max(left, right)
 
     def extract_min(self):
         """pop minimum key vertex and return key"""
@@ -188,89 +183,74 @@ class RankPairingHeap(object):
 
         min_node = self.min
 
-        if self.count == 1:
-            self.min, self.count = None, 0
-            return min_node
+        """ collect the other roots and the right spine of min's left child """
+        roots = []
+        node = min_node.next
+        while node != min_node:
+            roots.append(node)
+            node = node.next
 
-        """ add right spine to root-list """
-        node = self.min.left
+        node = min_node.left
         while node:
             node.parent, right = None, node.right
-            node.prev, node.next = self.min, self.min.next
-            node.prev.next = node.next.prev = node
-            node.right, node = None, right
-
-        """ unlink self.min and assign to next element """
-        self.min.next.prev, self.min.prev.next = self.min.prev, self.min.next
-        self.min = self.min.next
+            node.right = None
+            node.rank = node.left.rank + 1 if node.left else 0
+            roots.append(node)
+            node = right
+        min_node.left = min_node.next = min_node.prev = None
 
-        """ compress and decrement count """
-        self._compress()
+        self._consolidate(roots)
         self.count -= 1
-
         return min_node
 
+    def _consolidate(self, roots):
+        """one-pass linking: link each root with a waiting one of equal rank"""
+        self.min = None
+        buckets = {}
+        for node in roots:
+            other = buckets.pop(node.rank, None)
+            if other is None:
+                buckets[node.rank] = node
+            else:
+                self._add_root(self._link(node, other))
+        for node in buckets.values():
+            self._add_root(node)
+
     def decrease_key(self, node, key):
         """decrement specified node.key absolutely to key"""
         if key >= node.key:
             raise ValueError("Cannot decrease_distance with key >= current")
 
-        if node == self.min:
-            self.min.key = key
-            return
-
         node.key = key
 
-        """ remove node and L-child to new half-tree & replace in parent with node R-child """
-        if node.parent:
-            if node.parent.left == node:
-                node.parent.left = node.right
-                if node.right:
-                    node.right.parent = node.parent
-                node.right = None  # remove right child
-
-            elif node.parent.right == node:
-                node.parent.right = node.right
-                if node.right:
-                    node.right.parent = node.parent
-                node.right = None
-        else:  # in root-list
-            if self.min.key > node.key:
+        if node.parent is None:
+            if node.next is not None and node.key < self.min.key:  # in root-list
                 self.min = node
             return
 
-        """ relink second position in root list """
-        node.next, node.prev = self.min.next, self.min
-        node.next.prev = node.prev.next = node
-
-        """ update min """
-        if self.min.key > node.key:
-            self.min = node
-
-        """ update ranks for previous tree """
-        p = node.parent
-        node.parent = None
-
-        while p:
-            if not p.left and not p.right:  # leaf
-                p.rank = 0
-
-            elif not p.parent:  # root
-                if p.left:
-                    p.rank = p.left.rank + 1
-
-            elif not p.left:
-                p.rank = p.right.rank
-            elif not p.right:  # only one child
-                p.rank = p.left.rank
-
-            else:  # both children
-                if abs(p.left.rank - p.right.rank) > 1:
-                    p.rank = max(p.left.rank, p.right.rank)
-                else:
-                    p.rank = max(p.left.rank, p.right.rank) + 1
-
-            p = p.parent
+        parent = node.parent
+        self._cut(node)
+        self._add_root(node)
+
+        """ update ranks above the cut until one does not change """
+        while parent:
+            rank = self._rank(parent)
+            if rank >= parent.rank:
+                break
+            parent.rank = rank
+            parent = parent.parent
+
+    def _cut(self, node):
+        """replace node by its right child and make it a new half-tree"""
+        parent = node.parent
+        if parent.left is node:
+            parent.left = node.right
+        else:
+            parent.right = node.right
+        if node.right:
+            node.right.parent = parent
+        node.right = node.parent = None
+        node.rank = node.left.rank + 1 if node.left else 0
 
     def __len__(self):
         """number of elements currently in heap"""
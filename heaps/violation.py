@@ -1,15 +1,23 @@
 ''' Violation Heap Implementation.
 
+Roots are kept in a singly linked list with head and tail pointers. The
+children of a node are kept in a doubly linked list, most recently linked
+first; those first two children are the node's active children, and a node's
+rank is ceil((rank(z1) + rank(z2)) / 2) + 1 over its active children z1, z2.
+extract_min does 3-way joins of equal rank roots through a rank table that is
+reused across calls, and decrease_key only cuts when the heap order is
+violated or the node is not active.
+
 References:
 https://violationheap.weebly.com/
 https://arxiv.org/pdf/0812.2851.pdf
 https://github.com/haoliangx/Violation-Heap
 '''
 
-from math import ceil
+from heaps.base import Heap
 
 
-class ViolationHeap(object):
+class ViolationHeap(Heap):
     ''' Class defining the Violation Heap Specific Methods.'''
 
     class Node:
@@ -18,213 +26,218 @@ class ViolationHeap(object):
             self.key = data["key"]
             self.name = name
             self.data = data
+            # -1 once extracted
             self.rank = rank
+            # Siblings, or the next root for a root
             self.next = None
             self.prev = None
+            self.parent = None
+            # Most recently linked child
             self.child = None
 
     def __init__(self):
         '''Create a Violation Heap Object.'''
+        # Head and tail of the root list
         self.root = None
+        self.tail = None
+        self.min = None
         self.count = 0
-    
+        # Two slots per rank for 3-way joins, left all None between calls
+        self.rank_table = []
+
     def __len__(self):
         return self.count
 
     def _active(self, node):
-        '''Check if given node is active or not.''' 
-        parent = None
-        max = 2
-        p = node
-        if node.prev == None:
-            return True
-
-        # Moving backwards
-        while p.prev.child != p:
-            p = p.prev
-            max -= 1
-        parent = q.prev
-
-        return (True if max > 0 else False, parent)
-
-    def _join(self, nodel_a, nodel_b):
-        '''Join given node into existing heap.'''
-        if nodel_b == None:
-            return (nodel_a, nodel_b)
-
-        # If our current heap is empty, just add the node to it
-        if nodel_a == None:
-            nodel_a = nodel_b
-            return (nodel_a, nodel_b)
-        
-        # Swap, to get a new min
-        if nodel_a.key > nodel_b.key:
-            tmp = nodel_a
-            nodel_a = nodel_b
-            nodel_b = tmp
-        
-        # Connect node to the next to root and move curr to the end.
-        next = nodel_a.next
-        nodel_a.next = nodel_b
-        curr = nodel_b
-        
-        while curr.next:
-            curr = curr.next
-        if next:
-            curr.next = next
-        
-        return (nodel_a, nodel_b)
-
-    def _update_rank(self, node):
-        ''' Update given node's rank.'''
-        # Get the active children, which are the two last children
-        if node.child:
-            active1 = node.child
-            active2 = node.child.next
-
+        '''Check if given node is one of the two active children of its parent.'''
+        parent = node.parent
+        if parent is None:
+            return False
+        return parent.child is node or parent.child.next is node
+
+    def _rank(self, node):
+        '''Rank of node from the ranks of its active children.'''
         rank1 = rank2 = -1
-        if active1:
-            rank1 = active1.rank
-        if active2:
-            rank2 = active2.rank
-        node.rank = ceil((rank1 + rank2)/2) + 1
-
+        if node.child:
+            rank1 = node.child.rank
+            if node.child.next:
+                rank2 = node.child.next.rank
+        return -(-(rank1 + rank2) // 2) + 1
+
+    def _append_root(self, node):
+        '''Add a node to the end of the root list and update the minimum.'''
+        node.next = node.prev = node.parent = None
+        if self.root is None:
+            self.root = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        if self.min is None or node.key < self.min.key:
+            self.min = node
+
+    def _add_child(self, parent, node):
+        '''Link node as the first, active, child of parent.'''
+        node.parent = parent
+        node.prev = None
+        node.next = parent.child
+        if parent.child:
+            parent.child.prev = node
+        parent.child = node
+
+    def _unlink(self, parent, node):
+        '''Remove node from the child list of parent.'''
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            parent.child = node.next
+        if node.next:
+            node.next.prev = node.prev
+
+    def _join(self, node, other1, other2):
+        '''3-way join of equal rank roots, the smallest becomes the parent.'''
+        if other1.key < node.key:
+            node, other1 = other1, node
+        if other2.key < node.key:
+            node, other2 = other2, node
+        self._add_child(node, other1)
+        self._add_child(node, other2)
+        node.rank += 1
         return node
 
-    def _consolidate(self):
-        '''Consolidate the heap.'''
-        max_rank = 0
-        
-        # We need another list to do a 3 way join
-        rank_comb = [None] * (self.count * 100)
-        
-        # Move to a tmp list, do a deep copy
-        tmp = []
-        curr = self.root
-        if curr == None:
-            return
-        while curr:
-            tmp.append(curr)
-            curr = curr.next
-
-        # Perform 3-way join
-        for i in tmp:
-            i.prev = None
-            i.next = None
-
-            i1 = rank_comb[2 * i.rank]
-            i2 = rank_comb[(2 * i.rank) + 1]
-            while i1 and i2:
-                # Swap to get min
-                if i.key > i1.key:
-                    tmp_i = i
-                    i = i1
-                    i1 = tmp_i  
-                if i.key > i2.key:
-                    tmp_i = i
-                    i = i2
-                    i2 = tmp_i
-
-                i, i1 = self._join(i, i1)
-                i, i2 = self._join(i, i2)
-                rank_comb[2 * i.rank] = None
-                rank_comb[(2 * i.rank) + 1] = None
-                i.rank += 1
-                i1 = rank_comb[2 * i.rank]
-                i2 = rank_comb[(2 * i.rank) + 1]
-            if i1 == None:
-                rank_comb[2 * i.rank] = i
-            elif i2 == None:
-                rank_comb[(2 * i.rank) + 1] = i
-
-            if max_rank < i.rank:
-                max_rank = i.rank
-
-        # Consolidate the root list
-        self.root = None
-        for j in range(0, 2 * (max_rank + 1), 2):
-            tmp1 = rank_comb[j]
-            tmp2 = rank_comb[j + 1]
-            self.root, tmp1 = self._join(self.root, tmp1)
-            self.root, tmp2 = self._join(self.root, tmp2)
+    def _place(self, node):
+        '''Put a root in the rank table, 3-way joining while its rank is full.'''
+        table = self.rank_table
+        while True:
+            i = 2 * node.rank
+            if i + 1 >= len(table):
+                table.extend([None] * (i + 2 - len(table)))
+            if table[i] is None:
+                table[i] = node
+                return
+            if table[i + 1] is None:
+                table[i + 1] = node
+                return
+            node = self._join(node, table[i], table[i + 1])
+            table[i] = table[i + 1] = None
+
+    def _consolidate(self, removed, children):
+        '''Join the roots other than removed and the children of removed.'''
+        for node in (self.root, children):
+            while node:
+                next = node.next
+                if node is not removed:
+                    node.parent = node.prev = None
+                    self._place(node)
+                node = next
+
+        # Rebuild the root list from the table, finding the new minimum
+        self.root = self.tail = self.min = None
+        table = self.rank_table
+        for i in range(len(table)):
+            if table[i] is not None:
+                self._append_root(table[i])
+                table[i] = None
 
     def insert(self, data: dict, name=None):
         '''Add a new node into the heap.'''
         new_node = self.Node(data, name)
-        self.root, new_node = self._join(self.root, new_node)
+        self._append_root(new_node)
         self.count += 1
-        
-        return new_node
 
-    def extract_min(self):
-        '''Remove minimum value from the heap.'''
-        min_node = self.root
-        children = min_node.child
-
-        if min_node:
-            self.root = min_node.next
-            self.count -= 1
+        return new_node
 
-            # Join the children to the root list.
-            self.root, children = self._join(self.root, children)
+    def insert_many(self, items):
+        '''Add (data, name) pairs to the end of the root list.'''
+        nodes = [self.Node(data, name) for data, name in items]
+        for node in nodes:
+            self._append_root(node)
+        self.count += len(nodes)
 
-            # Now, we have to fix the heap...
-            self._consolidate()
+        return nodes
 
+    def meld(self, other):
+        '''Append the root list of other in O(1), leaving other empty.'''
+        if other.root is None:
+            return
+        if self.root is None:
+            self.root = other.root
         else:
+            self.tail.next = other.root
+        self.tail = other.tail
+        if self.min is None or other.min.key < self.min.key:
+            self.min = other.min
+        self.count += other.count
+        other.root = other.tail = other.min = None
+        other.count = 0
+
+    def extract_min(self):
+        '''Remove minimum value from the heap.'''
+        min_node = self.min
+        if min_node is None:
             raise ValueError("Cannot extract minimum: ViolationHeap is empty.")
 
+        # Now, we have to fix the heap, skipping the minimum in the root list
+        self._consolidate(min_node, min_node.child)
+        min_node.next = min_node.child = None
+        min_node.rank = -1
+        self.count -= 1
+
         return min_node
 
     def decrease_key(self, node, key):
         '''Decrease key from a given vertex.'''
         if key >= node.key:
             raise ValueError("Key provided >= to node.key!")
-        else:
-            node.key = key
-
-        if node.prev == None:
-            if node.key < self.root.key:
-                curr = self.root
-                while curr.next != node:
-                    curr= curr.next
-                curr.next = None
-                h = self.root
-                self.root = node
-                t = node
-                while t.next != None:
-                    t = t.next
-                t.next = h
-            return
+        node.key = key
 
-        node_is_active, parent = self._active(node)
-        if node_is_active and parent.key <= node.key:
+        if node.rank == -1:
+            # Already extracted
+            return
+        parent = node.parent
+        if parent is None:
+            if key < self.min.key:
+                self.min = node
+            return
+        if self._active(node) and parent.key <= key:
             return
 
-        n_rank = self._update_rank(node)
-        curr = node
-        curr_is_active, curr_parent = self._active(curr)
-        while curr_is_active and n_rank > node.rank:
-            n_rank = self._update_rank(curr_parent)
-            curr = curr_parent
-            if curr.prev == None:
-                break
-
-        if node.prev.child == node:
-            node.prev.child = node.next
+        self._cut(node)
+        node.rank = self._rank(node)
+        self._append_root(node)
+
+    def _cut(self, node):
+        '''Cut node from its parent, repairing the ranks above it.'''
+        parent = node.parent
+        # The active child of larger rank takes the place of node under parent
+        child = node.child
+        if child and child.next and child.next.rank > child.rank:
+            child = child.next
+        if child:
+            self._unlink(node, child)
+            child.parent = parent
+            child.prev, child.next = node.prev, node.next
+            if node.prev:
+                node.prev.next = child
+            else:
+                parent.child = child
             if node.next:
-                node.next.prev = node.prev
+                node.next.prev = child
         else:
-            node.prev.next = node.next
-            if (node.next):
-                node.next.prev = node.prev
-        node.next = None
-        node.prev = None
+            self._unlink(parent, node)
 
-        self._join(self.root, node)
+        # Update ranks upwards while they decrease through active nodes
+        curr = parent
+        while True:
+            rank = self._rank(curr)
+            if rank >= curr.rank:
+                break
+            curr.rank = rank
+            if not self._active(curr):
+                break
+            curr = curr.parent
 
     def find_min(self):
-        return self.root
+        return self.min
 
     def show(self):
         '''Print the heap.'''
@@ -1,71 +1,341 @@
+import os
 import sys
 
 sys.path.append(".")
+import multiprocessing
 import time
 import networkx as nx
 import matplotlib.pyplot as plt
 import csv
+import json
 from hwcounter import count, count_end
 
-from statistics import mean
+from functools import partial
+from math import ceil
+from statistics import mean, median, stdev
 from test_graphs.graph_generator import *
 from heaps.fibonacci import FibHeap
+from heaps.fibonacci_array import FibArrayHeap
 from heaps.violation import ViolationHeap
 from heaps.quake import QuakeHeap
 from heaps.minheap import MinHeap
-
-# from heaps.rankpairing import RankPairingHeap
-
-
-HEAPS = ["Quake", "Fibonacci", "Violation", "MinHeap"]
-# HEAPS = ["Quake", "Fibonacci", "Violation", "MinHeap", "RankPairing"]
-
-
-def get_heap(heap_choice):
-    """Get specified heap instance."""
+from heaps.radix import RadixHeap
+from heaps.dial import DialHeap
+from heaps.dary import DAryHeap
+from heaps.pairing import PairingHeap
+from heaps.rankpairing import RankPairingHeap
+from heaps.lazy import LazyHeap
+from heaps.instrument import HeapStats, instrument
+from csr import CSRGraph, SearchState, json_fingerprint
+
+HEAPS = [
+    "Quake",
+    "Fibonacci",
+    "FibonacciArray",
+    "Violation",
+    "MinHeap",
+    "Radix",
+    "Dial",
+    "DAry4",
+    "DAry8",
+    "Pairing",
+    "PairingMultipass",
+    "RankPairing",
+    "RankPairing2",
+    "Heapq",
+]
+
+
+def get_heap(heap_choice, size=0):
+    """Get specified heap instance.
+
+    "DAry<d>" gives a d-ary heap of that arity, e.g. "DAry4". size is the
+    expected number of inserts, used by heaps that preallocate their storage.
+    """
     if heap_choice == "Fibonacci":
         heap = FibHeap()
+    elif heap_choice == "FibonacciArray":
+        heap = FibArrayHeap(size)
     elif heap_choice == "Violation":
         heap = ViolationHeap()
     elif heap_choice == "MinHeap":
         heap = MinHeap()
+    elif heap_choice == "Pairing":
+        heap = PairingHeap()
+    elif heap_choice == "PairingMultipass":
+        heap = PairingHeap(multipass=True)
     elif heap_choice == "Quake":
         heap = QuakeHeap()
-    # elif heap_choice == "RankPairing":
-    #     heap = RankPairingHeap()
+    elif heap_choice == "Radix":
+        heap = RadixHeap()
+    elif heap_choice.startswith("DAry") and heap_choice[4:].isdigit():
+        heap = DAryHeap(int(heap_choice[4:]))
+    elif heap_choice == "Dial":
+        # Keys in the queue never span more than the largest edge weight
+        heap = DialHeap(MAX_WEIGHT_RANGE[1])
+    elif heap_choice == "RankPairing":
+        heap = RankPairingHeap()
+    elif heap_choice == "RankPairing2":
+        heap = RankPairingHeap(rank_type=2)
+    elif heap_choice == "Heapq":
+        heap = LazyHeap()
     else:
         raise NameError(f"{heap_choice} does not exist")
 
     return heap
 
 
-def dijkstra_path_heaps(G, source, target, heap):
-    """Dijkstra's Algorithm Implementation"""
-    G.nodes[source]["key"] = 0
+def dijkstra_path_heaps(G, source, target, heap, lazy=False, state=None):
+    """Dijkstra's Algorithm Implementation
 
-    for n in G.nodes:
-        G.nodes[n]["node"] = heap.insert(G.nodes[n], n)
+    Without lazy every vertex is loaded into the heap up front with a single
+    insert_many call. With lazy=True vertices are only inserted into the heap
+    when they are first reached, and the search stops as soon as target is
+    extracted.
+
+    The working distances and predecessors live in a SearchState rather than in
+    G's node attributes, so G is never modified. Pass the same state to repeated
+    queries to skip reallocating it; each query resets it in O(1).
+    """
+    if state is None:
+        state = SearchState.for_graph(G)
+    state.reset()
+    gen, stamp = state.generation, state.stamp
+    dist, pred, handle = state.dist, state.pred, state.handle
+    node_id, node_label = state.node_id, state.node_label
+
+    s = node_id(source)
+    t = node_id(target)
+    stamp[s], dist[s], pred[s] = gen, 0, None
+
+    if lazy:
+        handle[s] = heap.insert({"key": 0}, s)
+    else:
+        ids = [node_id(n) for n in G.nodes]
+        for v in ids:
+            if v != s:
+                stamp[v], dist[v], pred[v] = gen, float("inf"), None
+        nodes = heap.insert_many(({"key": dist[v]}, v) for v in ids)
+        for v, node in zip(ids, nodes):
+            handle[v] = node
 
     while heap:
-        n = heap.extract_min()
-        for edge in G.edges(n.name):
-            u, v = edge
-            dist = G.nodes[u]["key"] + G[u][v]["weight"]
-            if G.nodes[v]["key"] > dist:
-                G.nodes[v]["key"] = dist
-                G.nodes[v]["pred"] = u
-                heap.decrease_key(G.nodes[v]["node"], dist)
-
-    path = []
-    path.append(target)
-    pred = G.nodes[target]["pred"]
-    while pred is not None:
-        path.append(pred)
-        pred = G.nodes[pred]["pred"]
-    path.reverse()
+        u = heap.extract_min().name
+        if lazy and u == t:
+            break
+        du = dist[u]
+        for n, attrs in G.adj[node_label(u)].items():
+            v = node_id(n)
+            d = du + attrs["weight"]
+            if stamp[v] != gen:
+                stamp[v], dist[v], pred[v] = gen, d, u
+                handle[v] = heap.insert({"key": d}, v)
+            elif d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d)
+
+    return state.path(t)
+
+
+def dijkstra_path_csr(C, source, target, heap, lazy=False, state=None):
+    """Dijkstra's Algorithm over a CSRGraph, node state kept in flat lists
+
+    lazy and state have the same meaning as in dijkstra_path_heaps.
+    """
+    offsets, targets, weights = C.offsets, C.targets, C.weights
+    if state is None:
+        state = SearchState.for_graph(C)
+    state.reset()
+    gen, stamp = state.generation, state.stamp
+    dist, pred, handle = state.dist, state.pred, state.handle
+
+    s = C.node_id(source)
+    t = C.node_id(target)
+    stamp[s], dist[s], pred[s] = gen, 0, None
+
+    if lazy:
+        handle[s] = heap.insert({"key": 0}, s)
+    else:
+        for v in range(C.num_nodes):
+            if v != s:
+                stamp[v], dist[v], pred[v] = gen, float("inf"), None
+        ids = range(C.num_nodes)
+        handle[:] = heap.insert_many(({"key": dist[v]}, v) for v in ids)
+
+    while heap:
+        u = heap.extract_min().name
+        if lazy and u == t:
+            break
+        du = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            d = du + weights[i]
+            if stamp[v] != gen:
+                stamp[v], dist[v], pred[v] = gen, d, u
+                handle[v] = heap.insert({"key": d}, v)
+            elif d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d)
+
+    return state.path(t)
+
+
+def dijkstra_search(C, sources, heap, targets=None, state=None):
+    """Lazy Dijkstra from a set of source ids over a CSRGraph
+
+    All sources start at distance 0, as if joined to a virtual super-source.
+    The search stops once every id in targets is settled, or runs to completion
+    when targets is None. Returns the SearchState holding the results.
+    """
+    offsets, edge_targets, weights = C.offsets, C.targets, C.weights
+    if state is None:
+        state = SearchState.for_graph(C)
+    state.reset()
+    gen, stamp = state.generation, state.stamp
+    dist, pred, handle = state.dist, state.pred, state.handle
+
+    for s in sources:
+        if stamp[s] != gen:
+            stamp[s], dist[s], pred[s] = gen, 0, None
+            handle[s] = heap.insert({"key": 0}, s)
+
+    remaining = None if targets is None else set(targets)
+
+    while heap:
+        u = heap.extract_min().name
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+        du = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = edge_targets[i]
+            d = du + weights[i]
+            if stamp[v] != gen:
+                stamp[v], dist[v], pred[v] = gen, d, u
+                handle[v] = heap.insert({"key": d}, v)
+            elif d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d)
+
+    return state
+
+
+def dijkstra_one_to_many_heaps(G, sources, targets, heap, state=None):
+    """One-to-many / many-to-many shortest paths in a single search
+
+    sources is a single node or a collection of nodes searched together from a
+    virtual super-source; the search stops once every target is settled.
+    G is a CSRGraph, or a NetworkX graph which is converted on every call.
+    Returns {target: (distance, path)}, with (inf, [target]) when unreachable.
+    """
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+    if sources in C:
+        sources = [sources]
+    source_ids = [C.node_id(s) for s in sources]
+    target_ids = [C.node_id(t) for t in targets]
+
+    state = dijkstra_search(C, source_ids, heap, target_ids, state)
+
+    return {C.node_label(t): (state.distance(t), state.path(t)) for t in target_ids}
+
+
+def bidirectional_dijkstra_path_heaps(
+    G, source, target, heap_choice, states=None, heaps=None
+):
+    """Bidirectional Dijkstra's Algorithm
+
+    A forward search from source and a backward search from target, each with
+    its own heap from get_heap, expand whichever side has the smaller heap. mu
+    is the shortest source-target path seen where the two searches touch; once
+    the last keys extracted on both sides add up to at least mu, no shorter
+    path can remain. G is a CSRGraph or a NetworkX graph (converted per call),
+    states an optional (forward, backward) pair of SearchStates and heaps an
+    optional pair of empty heaps used instead of two from get_heap.
+    """
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_networkx(G)
+    graphs = (C, C.reverse())
+    if states is None:
+        states = (SearchState.for_graph(C), SearchState.for_graph(C))
+    if heaps is None:
+        heaps = (
+            get_heap(heap_choice, C.num_nodes),
+            get_heap(heap_choice, C.num_nodes),
+        )
+
+    s = C.node_id(source)
+    t = C.node_id(target)
+    for state, heap, v in zip(states, heaps, (s, t)):
+        state.reset()
+        state.stamp[v], state.dist[v], state.pred[v] = state.generation, 0, None
+        state.handle[v] = heap.insert({"key": 0}, v)
+
+    mu = 0 if s == t else float("inf")
+    meet = s
+    last = [0, 0]
+
+    while heaps[0] and heaps[1]:
+        if last[0] + last[1] >= mu:
+            break
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        offsets, targets, weights = (
+            graphs[side].offsets,
+            graphs[side].targets,
+            graphs[side].weights,
+        )
+        heap, state, other = heaps[side], states[side], states[1 - side]
+        gen, stamp = state.generation, state.stamp
+        dist, pred, handle = state.dist, state.pred, state.handle
+        other_gen, other_stamp, other_dist = (
+            other.generation,
+            other.stamp,
+            other.dist,
+        )
+
+        u = heap.extract_min().name
+        du = last[side] = dist[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            d = du + weights[i]
+            if stamp[v] != gen:
+                stamp[v], dist[v], pred[v] = gen, d, u
+                handle[v] = heap.insert({"key": d}, v)
+            elif d < dist[v]:
+                dist[v] = d
+                pred[v] = u
+                heap.decrease_key(handle[v], d)
+            else:
+                continue
+            if other_stamp[v] == other_gen and d + other_dist[v] < mu:
+                mu = d + other_dist[v]
+                meet = v
+
+    if mu == float("inf"):
+        return [target]
+
+    # source ... meet from the forward search, then meet ... target backwards
+    forward, backward = states
+    path = forward.path(meet)
+    v = backward.pred[meet]
+    while v is not None:
+        path.append(C.node_label(v))
+        v = backward.pred[v]
     return path
 
 
+def dijkstra_path_bidirectional(G, source, target, heaps, lazy=False, states=None):
+    """bidirectional_dijkstra_path_heaps with the driver signature of
+    dijkstra_time, heaps and states being (forward, backward) pairs.
+
+    The search always stops once the two sides meet, so lazy is ignored.
+    """
+    return bidirectional_dijkstra_path_heaps(G, source, target, None, states, heaps)
+
+
 def visualize_graph(G, path, heap_choice, show=True, labels=True, layout_type="spring"):
     """Visualize a Networkx graph object."""
     layout = getattr(nx, f"{layout_type}_layout")(G)
@@ -97,10 +367,6 @@ def sanity_check(heap_choice="Fibonacci", show=False):
     G.add_node("e")
     G.add_node("z")
 
-    nx.set_node_attributes(G, float("inf"), "key")
-    nx.set_node_attributes(G, None, "pred")
-    nx.set_node_attributes(G, None, "node")
-
     G.add_edge("a", "b", weight=4)
     G.add_edge("a", "c", weight=2)
     G.add_edge("b", "c", weight=1)
@@ -129,129 +395,381 @@ def smoke_tests(show=False):
             print(f"{heap} heap failed running the sanity check!")
 
 
-def dijkstra_time(G, source, target, heap):
-    """Compute Dijkstra's shortest path time."""
-    repeat = 3
-    runs = 10
+def dijkstra_time(
+    G,
+    source,
+    target,
+    heap_choice,
+    dijkstra=dijkstra_path_heaps,
+    lazy=False,
+    counts=False,
+    warmup=3,
+    runs=30,
+):
+    """Compute Dijkstra's shortest path time.
+
+    Every run gets a freshly allocated search state and a fresh heap, so each
+    one does the full work of a cold query. The first warmup runs are not
+    measured. Each measured run is timed on its own with time.perf_counter_ns
+    and the cycle counter, covering the heap construction and the search but
+    not the state allocation. Times are reported in seconds: mean ("avg_time"),
+    min, median, 95th percentile and standard deviation over the runs.
+
+    With counts=True one extra, untimed run on an instrumented heap records the
+    heap operation counts as "op_counts".
+
+    dijkstra=dijkstra_path_bidirectional gets a (forward, backward) pair of
+    heaps and of states per run, and the counts cover both heaps.
+    """
+    if runs < 1:
+        raise ValueError("dijkstra_time needs at least one measured run")
+    size = G.number_of_nodes()
+    sides = 2 if dijkstra is dijkstra_path_bidirectional else 1
+
+    def new_heap():
+        if sides == 1:
+            return get_heap(heap_choice, size)
+        return get_heap(heap_choice, size), get_heap(heap_choice, size)
+
+    def new_state():
+        if sides == 1:
+            return SearchState.for_graph(G)
+        return SearchState.for_graph(G), SearchState.for_graph(G)
+
     times = []
     cycles = []
 
-    # Add Graph attrs
-    nx.set_node_attributes(G, float("inf"), "key")
-    nx.set_node_attributes(G, None, "pred")
-    nx.set_node_attributes(G, None, "node")
-
     dijkstra_results = {}
     # Run Dijkstra's
-    for _ in range(repeat):
-        t0 = time.time()
+    for i in range(warmup + runs):
+        state = new_state()
+        t0 = time.perf_counter_ns()
         c0 = count()
-        for _ in range(runs):
-            dijkstra_results[G] = dijkstra_path_heaps(G, source, target, heap)
+        heap = new_heap()
+        dijkstra_results[G] = dijkstra(G, source, target, heap, lazy, state)
         c1 = count_end()
-        t1 = time.time()
-        times.append(t1 - t0)
-        cycles.append(c1 - c0)
+        t1 = time.perf_counter_ns()
+        if i >= warmup:
+            times.append((t1 - t0) / 1e9)
+            cycles.append(c1 - c0)
 
     # Get the results and pass them back
+    ordered = sorted(times)
     results = {
+        "warmup": warmup,
         "runs": runs,
-        "repeat": repeat,
         "avg_time": mean(times),
+        "min_time": ordered[0],
+        "median_time": median(times),
+        "p95_time": ordered[ceil(0.95 * runs) - 1],
+        "stdev_time": stdev(times) if runs > 1 else 0.0,
         "avg_cycles": round(mean(cycles)),
         "algo_res": dijkstra_results,
     }
 
+    if counts:
+        heap = new_heap()
+        stats = HeapStats()
+        for h in heap if sides == 2 else [heap]:
+            instrument(h, stats)
+        dijkstra(G, source, target, heap, lazy, new_state())
+        results["op_counts"] = stats.as_dict()
+
     return results
 
 
-def get_search_nodes(G):
-    """Get the source and target by getting the most distanced node pair."""
-    source = None
-    target = None
+def search_nodes_file(graph_file):
+    """Path of the search node pair (json) stored next to a graph json file"""
+    root, _ = os.path.splitext(graph_file)
+    return f"{root}.search"
 
-    max_len = -1
-    length = dict(nx.all_pairs_dijkstra_path_length(G))
 
-    # Search through to see which pair has greatest distance
-    for node_a in length:
-        for node_b in length[node_a]:
-            if length[node_a][node_b] > max_len:
-                max_len = length[node_a][node_b]
-                source = node_a
-                target = node_b
+def find_search_nodes(G, sweeps=4):
+    """Find a far apart node pair by repeated farthest-point sweeps.
 
-    return source, target
+    Starting from an arbitrary node, each sweep runs one single source Dijkstra
+    from the end of the previous one and moves to the farthest node it reached,
+    until the distance stops growing or sweeps runs out. The result is exact on
+    trees and close to the diameter in practice, at O(sweeps * E log V) cost.
 
+    G is a NetworkX graph or a CSRGraph. Returns (source, target, eccentricity).
+    """
+    if isinstance(G, CSRGraph):
+        state = SearchState.for_graph(G)
 
-def performance_test():
-    """Benchmarking Dijkstra with all heaps and graphs."""
+        def lengths(start):
+            dijkstra_search(G, [G.node_id(start)], MinHeap(), state=state)
+            return {
+                G.node_label(v): state.dist[v]
+                for v in range(G.num_nodes)
+                if state.reached(v)
+            }
 
-    # Get the graphs
-    test_graphs = get_graphs_from_file()
+        start = G.node_label(0) if G.num_nodes else None
+    else:
+        lengths = partial(nx.single_source_dijkstra_path_length, G)
+        start = next(iter(G), None)
+
+    source, target, eccentricity = None, None, -1
+    for _ in range(sweeps):
+        if start is None:
+            break
+        length = lengths(start)
+        end = max(length, key=length.get)
+        if length[end] <= eccentricity:
+            break
+        source, target, eccentricity = start, end, length[end]
+        start = end
+
+    return source, target, eccentricity
+
+
+def get_search_nodes(G, graph_file=None):
+    """Get the source and target as a far apart node pair.
+
+    Graphs read from a file (graph_file, by default G.graph["file"] for a
+    NetworkX graph) keep the pair and its eccentricity next to it, so it is
+    found once per graph, and again whenever the json_fingerprint of the file
+    changes.
+    """
+    if graph_file is None and not isinstance(G, CSRGraph):
+        graph_file = G.graph.get("file")
+    if graph_file is None:
+        source, target, _ = find_search_nodes(G)
+        return source, target
+
+    path = search_nodes_file(graph_file)
+    fingerprint = json_fingerprint(graph_file)
+    if os.path.exists(path):
+        with open(path) as f:
+            cached = json.load(f)
+        if cached.get("fingerprint") == fingerprint:
+            return cached["source"], cached["target"]
+
+    source, target, eccentricity = find_search_nodes(G)
+    # Written under a temporary name and renamed, as parallel performance_test
+    # workers may read and write the same file at once
+    tmp = f"{path}.{os.getpid()}"
+    with open(tmp, "w") as f:
+        json.dump(
+            {
+                "source": source,
+                "target": target,
+                "eccentricity": eccentricity,
+                "fingerprint": fingerprint,
+            },
+            f,
+        )
+    os.replace(tmp, path)
+    return source, target
 
-    results = {}
-    for heap_name in HEAPS:
-        print(f"Running: {heap_name}")
-        run_list = []
-        graph_count = 0
-        for G in test_graphs:
-            run_info = {}
-            source, target = get_search_nodes(G)
 
-            # Run Dijktra
-            run_info["time_info"] = dijkstra_time(
-                G, source, target, get_heap(heap_name)
-            )
+def _load_graph(i, path, csr):
+    """Read graph number i for performance_test, as a CSRGraph when csr is set.
 
-            # Record graph info
-            run_info["graph_info"] = {
-                "graph_obj": G,
-                "graph_num": graph_count,
-                "num_nodes": G.number_of_nodes(),
-                "num_edges": G.number_of_edges(),
-            }
-
-            print(
-                "graph: {}, num_nodes: {}, num_edges: {}, avg_time: {}, avg_cycles: {}, path_found = {}".format(
-                    graph_count,
-                    run_info["graph_info"]["num_nodes"],
-                    run_info["graph_info"]["num_edges"],
-                    run_info["time_info"]["avg_time"],
-                    run_info["time_info"]["avg_cycles"],
-                    run_info["time_info"]["algo_res"][G],
-                )
+    Returns the graph, its search nodes and its graph_info.
+    """
+    G = read_csr_graph(path) if csr else read_graph(path)
+    source, target = get_search_nodes(G, path)
+    graph_info = {
+        "graph_num": i,
+        "graph_file": path,
+        "num_nodes": G.number_of_nodes(),
+        "num_edges": G.number_of_edges(),
+    }
+    return G, source, target, graph_info
+
+
+def _time_heap(heap_name, graph, options):
+    """Time one heap on a graph loaded by _load_graph, return (heap_name, run info).
+
+    A CSRGraph is searched with dijkstra_path_csr. The path is keyed by the
+    graph number rather than by G, so the results hold no reference to the
+    graph once it has been benchmarked.
+    """
+    G, source, target, graph_info = graph
+    if "dijkstra" not in options:
+        dijkstra = dijkstra_path_csr if isinstance(G, CSRGraph) else dijkstra_path_heaps
+        options = dict(options, dijkstra=dijkstra)
+    time_info = dijkstra_time(G, source, target, heap_name, **options)
+    time_info["algo_res"] = {graph_info["graph_num"]: time_info["algo_res"][G]}
+    return heap_name, {"time_info": time_info, "graph_info": graph_info}
+
+
+# Options and last graph read of a performance_test worker process
+_worker = {}
+
+
+def _init_worker(csr, options, cores=None):
+    """Pool initializer: keep the options and pin to a core when given."""
+    _worker["csr"] = csr
+    _worker["options"] = options
+    _worker["path"] = _worker["graph"] = None
+    if cores is not None:
+        os.sched_setaffinity(0, {cores.get()})
+
+
+def _run_job(job):
+    """Time one (heap, graph) job in a worker.
+
+    Jobs arrive grouped by graph, so the worker keeps only the last graph it
+    read and reads a file again only when the job moves on to the next one.
+    """
+    heap_name, i, path = job
+    if _worker["path"] != path:
+        # Drop the previous graph before reading the next one
+        _worker["graph"] = None
+        _worker["graph"] = _load_graph(i, path, _worker["csr"])
+        _worker["path"] = path
+    return _time_heap(heap_name, _worker["graph"], _worker["options"])
+
+
+def _serial_runs(csr, options, pin=False):
+    """Yield (heap_name, run info) of each (heap, graph) job in turn, reading
+    each graph once.
+
+    With pin=True the process is pinned to its first available core while the
+    jobs run, and its affinity is restored afterwards.
+    """
+    affinity = os.sched_getaffinity(0) if pin else None
+    if pin:
+        os.sched_setaffinity(0, {min(affinity)})
+    try:
+        for i, path in enumerate(get_graph_files()):
+            graph = _load_graph(i, path, csr)
+            for heap_name in HEAPS:
+                yield _time_heap(heap_name, graph, options)
+    finally:
+        if pin:
+            os.sched_setaffinity(0, affinity)
+
+
+def _parallel_runs(csr, options, workers, pin=False):
+    """Yield (heap_name, run info) of each (heap, graph) job in order, from a
+    pool of workers processes.
+
+    The pool is terminated when the jobs are done, a worker raises or the
+    caller stops early.
+    """
+    cores = sorted(os.sched_getaffinity(0)) if pin else None
+    if workers is None:
+        workers = len(cores) if pin else os.cpu_count()
+    core_queue = None
+    if pin:
+        core_queue = multiprocessing.Queue()
+        for k in range(workers):
+            core_queue.put(cores[k % len(cores)])
+    jobs = (
+        (heap_name, i, path)
+        for i, path in enumerate(get_graph_files())
+        for heap_name in HEAPS
+    )
+    with multiprocessing.Pool(
+        workers, _init_worker, (csr, options, core_queue)
+    ) as pool:
+        yield from pool.imap(_run_job, jobs)
+
+
+def performance_test(
+    csr=False,
+    lazy=False,
+    counts=False,
+    warmup=3,
+    runs=30,
+    workers=1,
+    pin=False,
+    bidirectional=False,
+):
+    """Benchmarking Dijkstra with all heaps and graphs.
+
+    The graphs are streamed from test_graphs one at a time, each is timed with
+    every heap by dijkstra_time over warmup unmeasured and runs measured
+    searches, then dropped, so only the graph being benchmarked is in memory.
+
+    With csr=True each graph is read straight into a CSRGraph, mapped from its
+    binary <graph>.csr file when there is one, and searched with
+    dijkstra_path_csr, so neither loading nor the timings go through NetworkX.
+    With lazy=True the searches use lazy insertion and stop at the target. With
+    counts=True the heap operation counts of each search are recorded too.
+    With bidirectional=True every search is a bidirectional Dijkstra with a
+    heap of the kind under test on each side; combine it with csr=True so the
+    timings do not include converting the graph.
+
+    With workers > 1 the (heap, graph) jobs are spread over a pool of that many
+    processes, workers=None uses one per available core. Each worker keeps the
+    last graph it read, so a graph is in memory at most once per worker. With
+    pin=True each worker is pinned to its own core, or the serial run to one
+    core (Linux only), which keeps the scheduler from migrating a timed search.
+    The results are the same either way.
+    """
+    options = {"lazy": lazy, "counts": counts, "warmup": warmup, "runs": runs}
+    if bidirectional:
+        options["dijkstra"] = dijkstra_path_bidirectional
+
+    if workers == 1:
+        run_infos = _serial_runs(csr, options, pin)
+    else:
+        run_infos = _parallel_runs(csr, options, workers, pin)
+
+    results = {heap_name: [] for heap_name in HEAPS}
+    for heap_name, run_info in run_infos:
+        i = run_info["graph_info"]["graph_num"]
+        if heap_name == HEAPS[0]:
+            print(f"Running: graph {i}")
+        print(
+            "heap: {}, num_nodes: {}, num_edges: {}, avg_time: {}, median_time: {}, p95_time: {}, avg_cycles: {}, path_found = {}".format(
+                heap_name,
+                run_info["graph_info"]["num_nodes"],
+                run_info["graph_info"]["num_edges"],
+                run_info["time_info"]["avg_time"],
+                run_info["time_info"]["median_time"],
+                run_info["time_info"]["p95_time"],
+                run_info["time_info"]["avg_cycles"],
+                run_info["time_info"]["algo_res"][i],
             )
+        )
+        if counts:
+            print(f"op_counts: {run_info['time_info']['op_counts']}")
 
-            # Add the run info into list
-            run_list.append(run_info)
-            graph_count += 1
-
-        print(f"Done running for each graph: {heap_name}")
-        # Add the results
-        results[heap_name] = run_list
+        # Add the run info into list
+        results[heap_name].append(run_info)
 
     return results
 
 
 def report(results):
-    fields = ["num_nodes", "num_edges", "avg_time", "avg_cycles"]
+    """Write report.csv with the timings, plus the heap operation counts when
+    performance_test recorded them (NA for counts a heap cannot provide), and
+    paths.csv with the paths found."""
+    times = ["avg_time", "min_time", "median_time", "p95_time", "stdev_time"]
+    fields = ["num_nodes", "num_edges"] + times + ["avg_cycles"]
     rows = []
     paths = []
     for heap in results:
-        rows.append([heap])
-        rows.append(fields)
         heap_data = results[heap]
+        rows.append([heap])
+        if heap_data and "op_counts" in heap_data[0]["time_info"]:
+            rows.append(fields + HeapStats.FIELDS)
+        else:
+            rows.append(fields)
 
         paths.append([heap])
         for run in heap_data:
             graph_info = run["graph_info"]
             num_nodes = graph_info["num_nodes"]
             num_edges = graph_info["num_edges"]
-            avg_time = run["time_info"]["avg_time"]
-            avg_cycles = run["time_info"]["avg_cycles"]
-            rows.append([num_nodes, num_edges, avg_time, avg_cycles])
-            path = run["time_info"]["algo_res"].values()
+            time_info = run["time_info"]
+            row = [num_nodes, num_edges]
+            row += [time_info[field] for field in times]
+            row.append(time_info["avg_cycles"])
+            op_counts = time_info.get("op_counts")
+            if op_counts:
+                row += [
+                    "NA" if op_counts[field] is None else op_counts[field]
+                    for field in HeapStats.FIELDS
+                ]
+            rows.append(row)
+            path = time_info["algo_res"].values()
             for item in path:
                 paths.append(item)
 
@@ -5,10 +5,13 @@ import random
 import json
 import sys
 import os
+import multiprocessing
+from collections import deque
 
 from networkx.readwrite import json_graph
 
 sys.path.append('.')
+from csr import CSRGraph, csr_file
 
 MAX_VERTEX_RANGE = (10, 1000)
 MAX_EDGE_RANGE = (10, 1000)
@@ -46,34 +49,90 @@ def create_graph(v_range=MAX_VERTEX_RANGE, e_range=MAX_EDGE_RANGE, w_range=MAX_W
     return G
 
 
-def generate_graphs(x, graph_type="gnm_random_graph"):
-    """Create x number of graphs and return the list of them."""
-    graphs = []
-    for _ in range(x):
-        G = create_graph(MAX_VERTEX_RANGE, MAX_EDGE_RANGE, MAX_WEIGHT_RANGE, graph_type)
+def _pool_imap(func, args, workers, initializer=None):
+    """Yield func(*a) for each a in args in order, from a pool of workers processes.
+
+    At most 2 * workers results are in flight, so a slow consumer never has more
+    than that many graphs waiting in memory.
+    """
+    with multiprocessing.Pool(workers, initializer) as pool:
+        pending = deque()
+        for a in args:
+            pending.append(pool.apply_async(func, a))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def _create_graph(graph_type):
+    return create_graph(MAX_VERTEX_RANGE, MAX_EDGE_RANGE, MAX_WEIGHT_RANGE, graph_type)
+
+
+def generate_graphs(x, graph_type="gnm_random_graph", workers=1):
+    """Create x random graphs, yielding each connected one as it is made.
+
+    With workers > 1 the graphs are created in a pool of that many processes,
+    each seeded on its own.
+    """
+    if workers == 1:
+        graphs = (_create_graph(graph_type) for _ in range(x))
+    else:
+        graphs = _pool_imap(_create_graph, [(graph_type,)] * x, workers, np.random.seed)
+
+    for G in graphs:
         if G:
-            graphs.append(G)
+            yield G
 
-    return graphs
 
-def get_graphs_from_file(given_file_name=None):
-    """Read the graphs from the test_graphs folder."""
-    
-    # Grab the list of files from the given directory.
-    files = os.listdir(GRAPHS_DIR)
+def read_graph(path):
+    """Read a graph json file, remembering its path in G.graph["file"]"""
+    with open(path) as f:
+        adj_data = json.load(f)
+    G = json_graph.adjacency_graph(adj_data)
+    G.graph["file"] = path
+    return G
 
-    # Covert the data into a graph object and append it to the list
-    graphs = []
+
+def get_graph_files(given_file_name=None):
+    """Paths of the json graphs in the test_graphs folder, or of given_file_name."""
     if given_file_name:
-        if given_file_name.endswith(".json"):
-            with open(f"{GRAPHS_DIR}/{given_file_name}") as f:
-                    adj_data = json.load(f)
-                    graphs.append(json_graph.adjacency_graph(adj_data))
+        files = [given_file_name]
     else:
-        for file in files:
-            if file.endswith(".json"):
-                with open(f"{GRAPHS_DIR}/{file}") as f:
-                    adj_data = json.load(f)
-                    graphs.append(json_graph.adjacency_graph(adj_data))
+        files = os.listdir(GRAPHS_DIR)
+
+    return [f"{GRAPHS_DIR}/{file}" for file in files if file.endswith(".json")]
+
+
+def get_graphs_from_file(given_file_name=None, workers=1):
+    """Read the graphs from the test_graphs folder, yielding one at a time.
+
+    Only the graph being used is kept in memory; with workers > 1 the files
+    are parsed ahead in a pool of that many processes.
+    """
+    files = get_graph_files(given_file_name)
+    if workers == 1:
+        return (read_graph(path) for path in files)
+    return _pool_imap(read_graph, [(path,) for path in files], workers)
+
+
+def get_csr_graphs_from_file(given_file_name=None):
+    """Read the graphs from the test_graphs folder straight into CSRGraphs, yielding one at a time."""
+    return (read_csr_graph(path) for path in get_graph_files(given_file_name))
+
+
+def read_csr_graph(path):
+    """Map the binary <graph>.csr file of a graph json file if there is one,
+    converting it again first if the json has changed since, otherwise build
+    the CSRGraph from the json."""
+    binary = csr_file(path)
+    if not os.path.exists(binary):
+        return CSRGraph.from_json(path)
+    if not CSRGraph.is_current(binary, path):
+        CSRGraph.convert_json(path, binary)
+    return CSRGraph.load(binary)
+
 
-    return graphs
+def convert_graphs_to_csr():
+    """Write a binary <graph>.csr file next to every json graph in the test_graphs folder."""
+    return [CSRGraph.convert_json(path) for path in get_graph_files()]
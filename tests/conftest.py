@@ -0,0 +1,58 @@
+"""Shared Test Fixtures"""
+
+import json
+import os
+import random
+import pytest
+import networkx as nx
+
+
+# Small weighted graph with named nodes, same as main.sanity_check
+@pytest.fixture
+def G():
+    G = nx.Graph()
+    G.add_edge("a", "b", weight=4)
+    G.add_edge("a", "c", weight=2)
+    G.add_edge("b", "c", weight=1)
+    G.add_edge("b", "d", weight=5)
+    G.add_edge("c", "d", weight=8)
+    G.add_edge("c", "e", weight=10)
+    G.add_edge("d", "e", weight=2)
+    G.add_edge("d", "z", weight=6)
+    G.add_edge("e", "z", weight=5)
+    return G
+
+
+@pytest.fixture(scope="session")
+def weighted_graph():
+    """Builder of a seeded random graph with integer weights, by default with
+    80 nodes, 300 edges and weights in [10, 1000]"""
+
+    def build(directed=False, seed=3, nodes=80, edges=300, weights=(10, 1000)):
+        G = nx.gnm_random_graph(nodes, edges, seed=seed, directed=directed)
+        rng = random.Random(seed)
+        for u, v in G.edges:
+            G[u][v]["weight"] = rng.randint(*weights)
+        return G
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def write_json():
+    """Writer of a graph as a NetworkX adjacency json file, returns its path
+
+    With stale=True the file times are reset to the epoch, so files cached from
+    an earlier version of the json see a different json_fingerprint even when
+    the sizes match.
+    """
+
+    def write(G, path, stale=False):
+        path = str(path)
+        with open(path, "w") as f:
+            json.dump(nx.adjacency_data(G), f)
+        if stale:
+            os.utime(path, ns=(0, 0))
+        return path
+
+    return write
@@ -0,0 +1,91 @@
+"""ALT Unit Tests"""
+
+import pytest
+import networkx as nx
+from csr import CSRGraph, json_fingerprint
+from main import HEAPS, get_heap
+from alt import Landmarks, alt_path_heaps, landmarks_file, load_or_build
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_potential_is_lower_bound(weighted_graph, directed):
+    G = weighted_graph(directed)
+    landmarks = Landmarks.build(G, k=4)
+    assert len(landmarks) == 4
+    lengths = dict(nx.all_pairs_dijkstra_path_length(G))
+    for v in range(0, 80, 7):
+        for t in lengths[v]:
+            assert landmarks.potential(v, t) <= lengths[v][t]
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+@pytest.mark.parametrize("directed", [False, True])
+def test_alt_path_heaps(weighted_graph, heap_choice, directed):
+    G = weighted_graph(directed)
+    C = CSRGraph.from_networkx(G)
+    landmarks = Landmarks.build(C, k=4)
+    for source, target in [(0, 79), (5, 40), (33, 2)]:
+        path = alt_path_heaps(C, source, target, get_heap(heap_choice), landmarks)
+        if nx.has_path(G, source, target):
+            assert nx.path_weight(G, path, "weight") == nx.dijkstra_path_length(
+                G, source, target
+            )
+        else:
+            assert path == [target]
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_alt_path_heaps_sparse_directed(weighted_graph, heap_choice):
+    # Not strongly connected, so some potentials are infinite
+    G = weighted_graph(True, seed=0, nodes=40, edges=90, weights=(1, 20))
+    C = CSRGraph.from_networkx(G)
+    landmarks = Landmarks.build(C, k=4)
+    lengths = dict(nx.all_pairs_dijkstra_path_length(G))
+    for source in range(40):
+        for target in range(0, 40, 3):
+            path = alt_path_heaps(C, source, target, get_heap(heap_choice), landmarks)
+            if target in lengths[source]:
+                assert nx.path_weight(G, path, "weight") == lengths[source][target]
+            else:
+                assert path == [target]
+
+
+def test_load_or_build(tmp_path, weighted_graph, write_json):
+    graph_file = write_json(weighted_graph(), tmp_path / "graph.json")
+    C, built = load_or_build(graph_file, k=3)
+    assert landmarks_file(graph_file).endswith("graph.alt.npz")
+    _, loaded = load_or_build(graph_file, k=3)
+    assert loaded.landmarks == built.landmarks
+    assert loaded.forward == built.forward
+    assert loaded.backward is loaded.forward
+
+
+def test_load_or_build_disconnected(tmp_path, monkeypatch, write_json):
+    # Only 3 nodes are reachable from the first landmark, build stops early
+    G = nx.Graph()
+    G.add_weighted_edges_from([(0, 1, 2), (1, 2, 3), (3, 4, 1)])
+    graph_file = write_json(G, tmp_path / "graph.json")
+    _, built = load_or_build(graph_file, k=4)
+    assert len(built) < 4 and built.k == 4
+
+    def build(*args, **kwargs):
+        raise AssertionError("landmarks rebuilt")
+
+    monkeypatch.setattr(Landmarks, "build", build)
+    _, loaded = load_or_build(graph_file, k=4)
+    assert loaded.landmarks == built.landmarks and loaded.k == 4
+
+
+def test_load_or_build_regenerated_graph(tmp_path, weighted_graph, write_json):
+    G = weighted_graph()
+    graph_file = write_json(G, tmp_path / "graph.json")
+    _, built = load_or_build(graph_file, k=3)
+
+    # Same name, node and edge counts, different weights
+    nx.set_edge_attributes(G, 1, "weight")
+    write_json(G, graph_file, stale=True)
+    C, rebuilt = load_or_build(graph_file, k=3)
+    assert rebuilt.forward != built.forward
+    assert rebuilt.fingerprint == json_fingerprint(graph_file)
+    path = alt_path_heaps(C, 0, 79, get_heap("MinHeap"), rebuilt)
+    assert len(path) - 1 == nx.shortest_path_length(G, 0, 79)
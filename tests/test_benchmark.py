@@ -0,0 +1,213 @@
+"""Benchmark Harness Unit Tests"""
+
+import csv
+import json
+import multiprocessing
+import os
+import pytest
+import networkx as nx
+import main
+from main import dijkstra_time, dijkstra_path_csr, report
+from csr import CSRGraph
+from test_graphs import graph_generator
+from test_graphs.graph_generator import read_graph
+
+
+def test_dijkstra_time_stats(G):
+    results = dijkstra_time(G, "a", "z", "MinHeap", warmup=2, runs=20)
+    assert results["runs"] == 20
+    assert results["warmup"] == 2
+    assert results["min_time"] <= results["median_time"] <= results["p95_time"]
+    assert results["p95_time"] <= 20 * results["avg_time"]
+    assert results["stdev_time"] >= 0
+    assert results["algo_res"][G] == ["a", "c", "b", "d", "z"]
+
+
+def test_dijkstra_time_fresh_state_per_run(G, monkeypatch):
+    states = []
+    for_graph = main.SearchState.for_graph
+
+    def counting_for_graph(graph):
+        states.append(for_graph(graph))
+        return states[-1]
+
+    monkeypatch.setattr(main.SearchState, "for_graph", counting_for_graph)
+    dijkstra_time(G, "a", "z", "Fibonacci", warmup=1, runs=4)
+    assert len(states) == 5
+    assert all(state.generation == 1 for state in states)
+
+
+def test_dijkstra_time_csr(G):
+    C = CSRGraph.from_networkx(G)
+    results = dijkstra_time(C, "a", "z", "Pairing", dijkstra_path_csr, runs=3)
+    assert results["algo_res"][C] == ["a", "c", "b", "d", "z"]
+
+
+def test_dijkstra_time_needs_runs(G):
+    with pytest.raises(ValueError):
+        dijkstra_time(G, "a", "z", "MinHeap", runs=0)
+
+
+def test_report(G, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    time_info = dijkstra_time(G, "a", "z", "MinHeap", runs=2)
+    graph_info = {"num_nodes": 6, "num_edges": 9}
+    report({"MinHeap": [{"time_info": time_info, "graph_info": graph_info}]})
+    with open("report.csv") as csvfile:
+        rows = list(csv.reader(csvfile))
+    assert rows[0] == ["MinHeap"]
+    assert rows[1][2:7] == [
+        "avg_time",
+        "min_time",
+        "median_time",
+        "p95_time",
+        "stdev_time",
+    ]
+    assert rows[2][:2] == ["6", "9"]
+
+
+@pytest.fixture
+def graphs_dir(G, tmp_path, monkeypatch, write_json):
+    H = nx.path_graph(5)
+    nx.set_edge_attributes(H, 1, "weight")
+    for name, graph in (("G", G), ("H", H)):
+        write_json(graph, tmp_path / f"{name}.json")
+    monkeypatch.setattr(graph_generator, "GRAPHS_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_get_graphs_from_file_streams(graphs_dir):
+    graphs = graph_generator.get_graphs_from_file()
+    assert not isinstance(graphs, list)
+    sizes = sorted(G.number_of_nodes() for G in graphs)
+    assert sizes == [5, 6]
+    parsed = graph_generator.get_graphs_from_file(workers=2)
+    assert sorted(G.number_of_nodes() for G in parsed) == sizes
+
+
+def test_generate_graphs_parallel(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test_graphs").mkdir()
+    graphs = list(graph_generator.generate_graphs(4, workers=2))
+    assert all(nx.is_connected(G) for G in graphs)
+    assert len({(G.number_of_nodes(), G.number_of_edges()) for G in graphs}) == len(
+        graphs
+    )
+
+
+@pytest.mark.parametrize("csr", [False, True])
+def test_performance_test_parallel(graphs_dir, monkeypatch, csr):
+    monkeypatch.setattr(main, "HEAPS", ["MinHeap", "Pairing"])
+    serial = main.performance_test(csr, runs=2)
+    parallel = main.performance_test(csr, runs=2, workers=2, pin=True)
+    assert list(parallel) == ["MinHeap", "Pairing"]
+    for heap_name in serial:
+        assert len(parallel[heap_name]) == 2
+        for a, b in zip(serial[heap_name], parallel[heap_name]):
+            assert a["graph_info"] == b["graph_info"]
+            assert a["time_info"]["algo_res"] == b["time_info"]["algo_res"]
+    paths = [run["time_info"]["algo_res"] for run in parallel["Pairing"]]
+    assert {len(path) for res in paths for path in res.values()} == {5}
+
+
+def test_performance_test_pin_serial(graphs_dir, monkeypatch):
+    monkeypatch.setattr(main, "HEAPS", ["MinHeap"])
+    affinity = os.sched_getaffinity(0)
+    calls = []
+    monkeypatch.setattr(os, "sched_setaffinity", lambda pid, cores: calls.append(cores))
+    main.performance_test(runs=1, pin=True)
+    assert calls == [{min(affinity)}, affinity]
+
+
+def test_performance_test_worker_error(graphs_dir, monkeypatch):
+    def load_graph(i, path, csr):
+        raise RuntimeError(f"cannot read {path}")
+
+    monkeypatch.setattr(main, "_load_graph", load_graph)
+    with pytest.raises(RuntimeError):
+        main.performance_test(runs=1, workers=2)
+    assert multiprocessing.active_children() == []
+
+
+def test_find_search_nodes_tree():
+    T = nx.Graph()
+    T.add_edge(0, 1, weight=3)
+    T.add_edge(1, 2, weight=1)
+    T.add_edge(1, 3, weight=7)
+    T.add_edge(3, 4, weight=2)
+    T.add_edge(0, 5, weight=4)
+    source, target, eccentricity = main.find_search_nodes(T)
+    assert {source, target} == {4, 5}
+    assert eccentricity == 16
+    assert main.find_search_nodes(CSRGraph.from_networkx(T))[2] == 16
+
+
+def test_worker_reads_each_graph_once(graphs_dir, monkeypatch):
+    reads = []
+
+    def read_graph(path):
+        reads.append(path)
+        return graph_generator.read_graph(path)
+
+    monkeypatch.setattr(main, "read_graph", read_graph)
+    main._init_worker(False, {"warmup": 0, "runs": 1})
+    paths = graph_generator.get_graph_files()
+    for i, path in enumerate(paths):
+        for heap_name in ["MinHeap", "Pairing"]:
+            name, run_info = main._run_job((heap_name, i, path))
+            assert name == heap_name
+            assert run_info["graph_info"]["graph_file"] == path
+    assert reads == paths
+
+
+def test_performance_test_csr_skips_networkx(graphs_dir, monkeypatch):
+    def read_graph(path):
+        raise AssertionError("json parsed into NetworkX")
+
+    monkeypatch.setattr(main, "read_graph", read_graph)
+    monkeypatch.setattr(main, "HEAPS", ["MinHeap"])
+    results = main.performance_test(csr=True, runs=1)
+    sizes = sorted(run["graph_info"]["num_nodes"] for run in results["MinHeap"])
+    assert sizes == [5, 6]
+
+
+def test_get_search_nodes_cached(G, tmp_path, monkeypatch, write_json):
+    G = read_graph(write_json(G, tmp_path / "graph.json"))
+    source, target = main.get_search_nodes(G)
+    assert nx.dijkstra_path_length(G, source, target) == 14
+
+    with open(tmp_path / "graph.search") as f:
+        assert json.load(f)["eccentricity"] == 14
+    monkeypatch.setattr(main, "find_search_nodes", None)
+    assert main.get_search_nodes(G) == (source, target)
+
+
+def test_get_search_nodes_regenerated_graph(tmp_path, write_json):
+    P = nx.path_graph(6)
+    nx.set_edge_attributes(P, 1, "weight")
+    graph_file = write_json(P, tmp_path / "graph.json")
+    assert set(main.get_search_nodes(read_graph(graph_file))) == {0, 5}
+
+    # Same name, node and edge counts, different graph
+    write_json(nx.relabel_nodes(P, {0: 2, 2: 0}), graph_file, stale=True)
+    assert set(main.get_search_nodes(read_graph(graph_file))) == {2, 5}
+
+
+def test_dijkstra_time_bidirectional(G):
+    C = CSRGraph.from_networkx(G)
+    results = dijkstra_time(
+        C, "a", "z", "Pairing", main.dijkstra_path_bidirectional, counts=True, runs=3
+    )
+    assert results["algo_res"][C] == ["a", "c", "b", "d", "z"]
+    # Both heaps are counted, one insert per side for each endpoint at least
+    assert results["op_counts"]["inserts"] >= 2
+
+
+@pytest.mark.parametrize("csr", [False, True])
+def test_performance_test_bidirectional(graphs_dir, monkeypatch, csr):
+    monkeypatch.setattr(main, "HEAPS", ["MinHeap", "RankPairing"])
+    results = main.performance_test(csr, runs=1, bidirectional=True)
+    plain = main.performance_test(csr, runs=1)
+    for heap_name in results:
+        for a, b in zip(results[heap_name], plain[heap_name]):
+            assert a["time_info"]["algo_res"] == b["time_info"]["algo_res"]
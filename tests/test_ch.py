@@ -0,0 +1,74 @@
+"""Contraction Hierarchy Unit Tests"""
+
+import pytest
+import networkx as nx
+from csr import CSRGraph, json_fingerprint
+from main import HEAPS
+from ch import ContractionHierarchy, ch_path_heaps, ch_file, load_or_build
+
+
+@pytest.fixture(scope="module")
+def hierarchies(weighted_graph):
+    return {
+        directed: ContractionHierarchy.build(weighted_graph(directed))
+        for directed in (False, True)
+    }
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_ranks_are_an_order(hierarchies, directed):
+    ch = hierarchies[directed]
+    assert sorted(ch.rank) == list(range(80))
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+@pytest.mark.parametrize("directed", [False, True])
+def test_ch_path_heaps(hierarchies, weighted_graph, heap_choice, directed):
+    G = weighted_graph(directed)
+    ch = hierarchies[directed]
+    for source, target in [(0, 79), (5, 40), (33, 2), (7, 7)]:
+        path = ch_path_heaps(ch, source, target, heap_choice)
+        if nx.has_path(G, source, target):
+            assert path[0] == source and path[-1] == target
+            # Unpacked paths only use original edges
+            assert nx.path_weight(G, path, "weight") == nx.dijkstra_path_length(
+                G, source, target
+            )
+        else:
+            assert path == [target]
+
+
+def test_named_nodes():
+    G = nx.Graph()
+    G.add_weighted_edges_from(
+        [("a", "b", 4), ("a", "c", 2), ("b", "c", 1), ("b", "d", 5), ("d", "z", 6)]
+    )
+    ch = ContractionHierarchy.build(CSRGraph.from_networkx(G))
+    assert ch_path_heaps(ch, "a", "z", "MinHeap") == ["a", "c", "b", "d", "z"]
+
+
+def test_load_or_build(tmp_path, weighted_graph, write_json):
+    graph_file = write_json(weighted_graph(), tmp_path / "graph.json")
+    _, built = load_or_build(graph_file)
+    assert ch_file(graph_file).endswith("graph.ch.npz")
+    _, loaded = load_or_build(graph_file)
+    assert list(loaded.rank) == list(built.rank)
+    assert list(loaded.up_middle) == list(built.up_middle)
+    assert ch_path_heaps(loaded, 0, 79, "MinHeap") == ch_path_heaps(
+        built, 0, 79, "MinHeap"
+    )
+
+
+def test_load_or_build_regenerated_graph(tmp_path, weighted_graph, write_json):
+    G = weighted_graph()
+    graph_file = write_json(G, tmp_path / "graph.json")
+    load_or_build(graph_file)
+
+    # Same name, node and edge counts, different weights
+    nx.set_edge_attributes(G, 1, "weight")
+    write_json(G, graph_file, stale=True)
+    _, ch = load_or_build(graph_file)
+    assert ch.fingerprint == json_fingerprint(graph_file)
+    for target in range(0, 80, 9):
+        path = ch_path_heaps(ch, 0, target, "MinHeap")
+        assert len(path) - 1 == nx.shortest_path_length(G, 0, target)
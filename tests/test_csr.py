@@ -0,0 +1,220 @@
+"""CSR Graph Unit Tests"""
+
+import os
+import pytest
+import networkx as nx
+from csr import CSRGraph, SearchState
+from test_graphs.graph_generator import read_csr_graph
+from main import (
+    HEAPS,
+    get_heap,
+    dijkstra_path_csr,
+    dijkstra_path_heaps,
+    dijkstra_one_to_many_heaps,
+    bidirectional_dijkstra_path_heaps,
+)
+
+
+def test_from_networkx(G):
+    C = CSRGraph.from_networkx(G)
+    assert C.number_of_nodes() == 6
+    assert C.number_of_edges() == 9
+    assert len(C.targets) == len(C.weights) == 18
+    a = C.node_id("a")
+    assert sorted((C.node_label(v), w) for v, w in C.neighbors(a)) == [
+        ("b", 4),
+        ("c", 2),
+    ]
+
+
+def test_integer_labels_are_ids():
+    C = CSRGraph.from_networkx(nx.path_graph(4))
+    assert C.labels is None
+    assert C.node_id(3) == 3
+    assert C.weights.typecode == "q"
+
+
+def test_from_json(tmp_path, G, write_json):
+    C = CSRGraph.from_json(write_json(G, tmp_path / "graph.json"))
+    assert C.number_of_edges() == 9
+    assert list(C.offsets) == list(CSRGraph.from_networkx(G).offsets)
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_dijkstra_path_csr(G, heap_choice):
+    C = CSRGraph.from_networkx(G)
+    path = dijkstra_path_csr(C, "a", "z", get_heap(heap_choice))
+    assert path == nx.dijkstra_path(G, "a", "z")
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_dijkstra_path_csr_lazy(G, heap_choice):
+    C = CSRGraph.from_networkx(G)
+    heap = get_heap(heap_choice)
+    path = dijkstra_path_csr(C, "a", "d", heap, lazy=True)
+    assert path == nx.dijkstra_path(G, "a", "d")
+    # Stopped at d before reaching z
+    assert len(heap) < C.num_nodes
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_search_state_reuse(G, heap_choice):
+    state = SearchState.for_graph(G)
+    for source, target in [("a", "z"), ("z", "a"), ("e", "b"), ("a", "z")]:
+        path = dijkstra_path_heaps(
+            G, source, target, get_heap(heap_choice), state=state
+        )
+        assert path == nx.dijkstra_path(G, source, target)
+    assert state.generation == 4
+    # Search state never leaks into the graph
+    assert all(not attrs for _, attrs in G.nodes(data=True))
+
+
+def test_search_state_reset():
+    state = SearchState(3)
+    state.reset()
+    state.stamp[1], state.dist[1] = state.generation, 5
+    assert state.distance(1) == 5
+    state.reset()
+    assert not state.reached(1)
+    assert state.distance(1) == float("inf")
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_dijkstra_one_to_many_heaps_single_source(G, heap_choice):
+    results = dijkstra_one_to_many_heaps(G, "a", ["z", "d", "a"], get_heap(heap_choice))
+    assert set(results) == {"z", "d", "a"}
+    for target, (dist, path) in results.items():
+        assert dist == nx.dijkstra_path_length(G, "a", target)
+        assert path == nx.dijkstra_path(G, "a", target)
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_dijkstra_one_to_many_heaps_multi_source(G, heap_choice):
+    C = CSRGraph.from_networkx(G)
+    results = dijkstra_one_to_many_heaps(
+        C, {"a", "z"}, ["c", "e", "z"], get_heap(heap_choice)
+    )
+    assert results["c"] == (2, ["a", "c"])
+    assert results["e"] == (5, ["z", "e"])
+    assert results["z"] == (0, ["z"])
+
+
+def test_dijkstra_one_to_many_heaps_unreachable(G):
+    G.add_node("x")
+    results = dijkstra_one_to_many_heaps(G, "a", ["x"], get_heap("MinHeap"))
+    assert results["x"] == (float("inf"), ["x"])
+
+
+def test_reverse():
+    D = nx.DiGraph()
+    D.add_edge(0, 1, weight=3)
+    D.add_edge(0, 2, weight=1)
+    D.add_edge(2, 1, weight=1)
+    R = CSRGraph.from_networkx(D).reverse()
+    assert sorted(R.neighbors(1)) == [(0, 3), (2, 1)]
+    assert list(R.neighbors(0)) == []
+    assert R.reverse().reverse() is R
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_bidirectional_dijkstra(G, heap_choice):
+    for source, target in [("a", "z"), ("z", "b"), ("c", "c")]:
+        path = bidirectional_dijkstra_path_heaps(G, source, target, heap_choice)
+        assert nx.path_weight(G, path, "weight") == nx.dijkstra_path_length(
+            G, source, target
+        )
+        assert path[0] == source and path[-1] == target
+
+
+def test_bidirectional_dijkstra_directed():
+    D = nx.gnm_random_graph(60, 240, seed=7, directed=True)
+    for i, (u, v) in enumerate(D.edges):
+        D[u][v]["weight"] = 1 + (i * 37) % 50
+    C = CSRGraph.from_networkx(D)
+    for target in range(1, 60):
+        path = bidirectional_dijkstra_path_heaps(C, 0, target, "MinHeap")
+        if nx.has_path(D, 0, target):
+            assert nx.path_weight(D, path, "weight") == nx.dijkstra_path_length(
+                D, 0, target
+            )
+        else:
+            assert path == [target]
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_save_load(tmp_path, G, numpy):
+    C = CSRGraph.from_networkx(G)
+    C.save(tmp_path / "graph.csr")
+    L = CSRGraph.load(tmp_path / "graph.csr", numpy)
+    assert L.labels == C.labels
+    assert list(L.offsets) == list(C.offsets)
+    assert list(L.targets) == list(C.targets)
+    assert list(L.weights) == list(C.weights)
+    assert dijkstra_path_csr(L, "a", "z", get_heap("Radix")) == [
+        "a",
+        "c",
+        "b",
+        "d",
+        "z",
+    ]
+
+
+def test_save_load_directed_float(tmp_path):
+    D = nx.DiGraph()
+    D.add_weighted_edges_from([(0, 1, 1.5), (1, 2, 2.25), (0, 2, 4.0), (2, 0, 0.5)])
+    C = CSRGraph.from_networkx(D)
+    C.save(tmp_path / "graph.csr")
+    header = CSRGraph.read_header(tmp_path / "graph.csr")
+    assert header["directed"] and header["num_arcs"] == 4
+    L = CSRGraph.load(tmp_path / "graph.csr")
+    assert L.labels is None and L.directed
+    assert L.weights.format == "d"
+    assert list(L.reverse().weights) == list(C.reverse().weights)
+
+
+def test_convert_json(tmp_path, G, write_json):
+    binary = CSRGraph.convert_json(write_json(G, tmp_path / "graph.json"))
+    assert binary == str(tmp_path / "graph.csr")
+    assert CSRGraph.load(binary).number_of_edges() == 9
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "graph.csr"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        CSRGraph.load(path)
+
+
+def test_short_file_is_not_current(tmp_path, G, write_json):
+    path = write_json(G, tmp_path / "graph.json")
+    binary = tmp_path / "graph.csr"
+    binary.write_bytes(b"CSRGRAPH")
+    with pytest.raises(ValueError):
+        CSRGraph.read_header(binary)
+    assert not CSRGraph.is_current(binary, path)
+
+
+def test_save_keeps_mapped_file(tmp_path, G):
+    C = CSRGraph.from_networkx(G)
+    C.save(tmp_path / "graph.csr")
+    L = CSRGraph.load(tmp_path / "graph.csr")
+    nx.set_edge_attributes(G, 1, "weight")
+    CSRGraph.from_networkx(G).save(tmp_path / "graph.csr")
+    assert list(L.weights) == list(C.weights)
+    assert set(CSRGraph.load(tmp_path / "graph.csr").weights) == {1}
+    assert os.listdir(tmp_path) == ["graph.csr"]
+
+
+def test_stale_binary_is_converted_again(tmp_path, G, write_json):
+    path = write_json(G, tmp_path / "graph.json")
+    binary = CSRGraph.convert_json(path)
+    assert CSRGraph.is_current(binary, path)
+
+    # Regenerated under the same name, same node and edge counts
+    nx.set_edge_attributes(G, 1, "weight")
+    write_json(G, path, stale=True)
+    assert not CSRGraph.is_current(binary, path)
+    C = read_csr_graph(path)
+    assert set(C.weights) == {1}
+    assert CSRGraph.is_current(binary, path)
@@ -0,0 +1,96 @@
+import pytest
+from heaps import dary
+
+# Set up an empty d-ary heap of several arities for test functions
+@pytest.fixture(params=[2, 3, 4, 8])
+def uut(request):
+    return dary.DAryHeap(request.param)
+
+
+def test_insert(uut):
+    node = {"key": 5, "value": "apples"}
+    test_node = uut.insert(node, node["value"])
+    assert test_node.key == 5
+    assert test_node.name == "apples"
+
+
+def test_find_min(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()  # Extract 4
+    uut.extract_min()  # Extract 5
+    assert uut.find_min().key == 7
+
+
+def test_extract_min(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    assert uut.extract_min().key == 4
+    assert uut.extract_min().key == 5
+
+
+def test_decrease_key(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    x = uut.insert({"key": 100})
+    y = uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()
+    uut.decrease_key(x, 3)
+    assert uut.extract_min().key == 3  # extract x
+    uut.decrease_key(y, 8)
+    assert y.key == 8
+
+
+def test_decrease_key_greater(uut):
+    x = uut.insert({"key": 5})
+    with pytest.raises(ValueError):
+        uut.decrease_key(x, 10)
+
+
+def test_heaps_are_independent(uut):
+    other = dary.DAryHeap(uut.d)
+    uut.insert({"key": 1})
+    assert len(other) == 0
+
+
+def test_decrease_key_tracks_position(uut):
+    nodes = [uut.insert({"key": k}) for k in range(10, 0, -1)]
+    uut.decrease_key(nodes[0], 0)
+    assert nodes[0].pos == 0
+    assert all(uut.heap[node.pos] is node for node in nodes)
+    assert [uut.extract_min().key for _ in range(10)] == list(range(10))
+
+
+def test_arity_too_small():
+    with pytest.raises(ValueError):
+        dary.DAryHeap(1)
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = dary.DAryHeap(uut.d)
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
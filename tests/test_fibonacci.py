@@ -1,4 +1,5 @@
 import pytest
+from math import log
 from heaps import fibonacci
 
 # Set up an empty Fibonacci heap for test functions
@@ -14,12 +15,12 @@ def test_insert(uut):
     assert test_node.name == "apples"
 
 
-def test__find_min_node(uut):
+def test_find_min_after_inserts(uut):
     uut.insert({"key": 8})
     uut.insert({"key": 7})
     uut.insert({"key": -9})
     uut.insert({"key": 4})
-    assert uut._find_min_node().key == -9
+    assert uut.find_min().key == -9
 
 
 def test_find_min(uut):
@@ -60,3 +61,63 @@ def test_decrease_key_greater(uut):
     x = uut.insert({"key": 5})
     with pytest.raises(ValueError):
         uut.decrease_key(x, 10)
+
+
+def test_extract_min_equal_keys(uut):
+    uut.insert({"key": 2})
+    uut.insert({"key": 0})
+    uut.insert({"key": 2})
+    assert uut.extract_min().key == 0
+    assert uut.extract_min().key == 2
+    assert uut.extract_min().key == 2
+    assert len(uut) == 0
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_degree_table_reused(uut):
+    for k in range(100):
+        uut.insert({"key": k})
+    uut.extract_min()
+    uut.extract_min()
+    assert len(uut.degree_table) <= int(log(99) / fibonacci.LOG_PHI) + 2
+    assert all(node is None for node in uut.degree_table)
+    assert uut.root_list is uut.min_node
+    assert uut.min_node.key == 2
+
+
+def test_cascading_cut_marks_parent(uut):
+    nodes = [uut.insert({"key": k}) for k in range(33)]
+    uut.extract_min()  # Consolidate into one binomial tree of 32 nodes
+    x = next(
+        n for n in nodes[1:] if n.parent and n.parent.parent and n.parent.degree > 1
+    )
+    p = x.parent
+    uut.decrease_key(x, -1)
+    assert x.parent is None and p.mark
+    y = next(n for n in nodes[1:] if n.parent is p)
+    uut.decrease_key(y, -2)
+    # p lost a second child, so it is cut too
+    assert p.parent is None and not p.mark
+    assert [uut.extract_min().key for _ in range(len(uut))][:2] == [-2, -1]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = fibonacci.FibHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
@@ -0,0 +1,144 @@
+""" Array Fibonacci Heap Unit Tests"""
+
+import pytest
+from heaps.fibonacci_array import FibArrayHeap
+
+
+# Empty heaps with no preallocation and with room for every test's inserts
+@pytest.fixture(params=[0, 64], ids=["grow", "preallocated"])
+def uut(request):
+    return FibArrayHeap(request.param)
+
+
+def test_insert(uut):
+    node = {"key": 5, "value": "apples"}
+    slot = uut.insert(node, node["value"])
+    assert slot == 0
+    assert uut.key[slot] == 5
+    assert uut.find_min() == ("apples", 5)
+
+
+def test_insert_count(uut):
+    uut.insert({"key": 8})
+    uut.insert({"key": 7})
+    uut.insert({"key": -9})
+    uut.insert({"key": 4})
+    assert len(uut) == 4
+
+
+def test_find_min(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()  # Extract 4
+    uut.extract_min()  # Extract 5
+    assert uut.find_min().key == 7
+
+
+def test_extract_min(uut):
+    uut.insert({"key": 5}, "a")
+    uut.insert({"key": 4}, "b")
+    uut.insert({"key": 7}, "c")
+    assert uut.extract_min().name == "b"
+    assert uut.extract_min().key == 5
+
+
+def test_extract_min_empty(uut):
+    with pytest.raises(ValueError):
+        uut.extract_min()
+
+
+def test_decrease_key(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    x = uut.insert({"key": 100})
+    y = uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()
+    uut.decrease_key(x, 3)
+    assert uut.extract_min().key == 3  # extract x
+    uut.decrease_key(y, 8)
+    assert uut.key[y] == 8
+
+
+def test_decrease_key_greater(uut):
+    x = uut.insert({"key": 5})
+    with pytest.raises(ValueError):
+        uut.decrease_key(x, 10)
+
+
+def test_extract_min_equal_keys(uut):
+    uut.insert({"key": 2})
+    uut.insert({"key": 0})
+    uut.insert({"key": 2})
+    assert uut.extract_min().key == 0
+    assert uut.extract_min().key == 2
+    assert uut.extract_min().key == 2
+    assert len(uut) == 0
+
+
+def test_cascading_cut(uut):
+    keys = list(range(40))
+    slots = [uut.insert({"key": k}, k) for k in keys]
+    uut.extract_min()  # Consolidate into deep trees
+    for k in (39, 38, 37, 36, 35, 30, 25, 20):
+        uut.decrease_key(slots[k], -k)
+    out = [uut.extract_min().key for _ in range(len(uut))]
+    assert out == sorted(out)
+    assert len(out) == 39
+
+
+def test_grow():
+    uut = FibArrayHeap(2)
+    for k in range(100, 0, -1):
+        uut.insert({"key": k})
+    assert len(uut.name) >= 100
+    assert [uut.extract_min().key for _ in range(100)] == list(range(1, 101))
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    slots = uut.insert_many(({"key": k}, k) for k in keys)
+    assert slots == [1, 2, 3, 4, 5, 6]
+    assert [uut.name[slot] for slot in slots] == keys
+    assert len(uut) == 7
+    uut.decrease_key(slots[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = FibArrayHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 2}, "c")
+    offset = uut.meld(other)
+    assert offset == 1
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(a, 3)
+    uut.decrease_key(b + offset, 1)
+    assert [uut.extract_min().name for _ in range(3)] == ["b", "c", "a"]
+    with pytest.raises(ValueError):
+        other.decrease_key(b, 0)
+
+
+def test_meld_trees(uut):
+    # Both heaps have consolidated trees, marks and extracted slots
+    other = FibArrayHeap()
+    mine = uut.insert_many(({"key": k}, ("a", k)) for k in range(0, 40, 2))
+    theirs = other.insert_many(({"key": k}, ("b", k)) for k in range(1, 40, 2))
+    uut.extract_min()
+    other.extract_min()
+    uut.decrease_key(mine[15], -1)
+    other.decrease_key(theirs[12], -2)
+    offset = uut.meld(other)
+    uut.decrease_key(theirs[7] + offset, -3)
+    keys = [uut.extract_min().key for _ in range(len(uut))]
+    expected = sorted(
+        [k for k in range(2, 40, 2) if k != 30] + [-1]
+        + [k for k in range(3, 40, 2) if k not in (25, 15)] + [-2, -3]
+    )
+    assert keys == expected
@@ -0,0 +1,102 @@
+"""Heap Instrumentation Unit Tests"""
+
+import csv
+import pytest
+import networkx as nx
+from heaps.instrument import HeapStats, instrument
+from heaps.minheap import MinHeap
+from heaps.quake import QuakeHeap
+from heaps.radix import RadixHeap
+from main import HEAPS, get_heap, dijkstra_path_heaps, dijkstra_time, report
+
+
+def test_disabled_heap_untouched():
+    heap = MinHeap()
+    heap.insert({"key": 1})
+    assert "insert" not in vars(heap)
+    assert type(heap.find_min().key) is int
+
+
+def test_operation_counts():
+    heap = MinHeap()
+    stats = instrument(heap)
+    nodes = [heap.insert({"key": k}) for k in (5, 3, 8)]
+    heap.decrease_key(nodes[2], 1)
+    assert heap.extract_min().key == 1
+    assert stats.inserts == 3
+    assert stats.decrease_keys == 1
+    assert stats.extract_mins == 1
+    assert stats.peak_size == 3
+    assert stats.comparisons > 0
+    assert stats.links == stats.cuts == 0
+
+
+def test_insert_many_fallback_counted_once():
+    heap = RadixHeap()
+    stats = instrument(heap)
+    heap.insert_many(({"key": k}, k) for k in (4, 2, 9))
+    assert stats.inserts == 3
+    assert stats.peak_size == 3
+    assert heap.extract_min().name == 2
+
+
+def test_structural_events():
+    heap = QuakeHeap()
+    stats = instrument(heap)
+    nodes = [heap.insert({"key": k}) for k in range(64)]
+    heap.extract_min()
+    heap.decrease_key(nodes[40], -1)
+    assert stats.links > 0
+    assert stats.consolidations == 1
+    assert stats.cuts == 1
+    assert set(stats.as_dict()) == set(HeapStats.FIELDS)
+
+
+@pytest.mark.parametrize("heap_choice", HEAPS)
+def test_instrumented_dijkstra(G, heap_choice):
+    heap = get_heap(heap_choice)
+    stats = instrument(heap)
+    path = dijkstra_path_heaps(G, "a", "z", heap)
+    assert nx.path_weight(G, path, "weight") == 14
+    assert stats.inserts == stats.extract_mins == 6
+
+
+def test_dijkstra_time_counts(G):
+    results = dijkstra_time(G, "a", "z", "Fibonacci", counts=True)
+    assert results["op_counts"]["inserts"] == 6
+    assert "op_counts" not in dijkstra_time(G, "a", "z", "Fibonacci")
+
+
+@pytest.mark.parametrize("heap_choice", ["Pairing", "RankPairing", "Violation"])
+def test_cuts_counted(heap_choice):
+    heap = get_heap(heap_choice)
+    stats = instrument(heap)
+    nodes = [heap.insert({"key": k}) for k in range(2, 34)]
+    heap.extract_min()
+    heap.decrease_key(nodes[0], 1)  # Extracted, no cut
+    # Any node below another one is cut when decreased below every key
+    child = next(
+        node
+        for node in nodes[1:]
+        if (node.parent if hasattr(node, "parent") else node.prev) is not None
+    )
+    heap.decrease_key(child, 0)
+    assert stats.cuts == 1
+    assert heap.extract_min().key == 0
+
+
+def test_typed_keys_not_counted(G, tmp_path, monkeypatch):
+    heap = get_heap("FibonacciArray")
+    stats = instrument(heap)
+    dijkstra_path_heaps(G, "a", "z", heap)
+    assert stats.comparisons is None
+    assert stats.inserts == 6
+
+    monkeypatch.chdir(tmp_path)
+    time_info = dijkstra_time(G, "a", "z", "FibonacciArray", counts=True, runs=1)
+    graph_info = {"num_nodes": 6, "num_edges": 9}
+    report({"FibonacciArray": [{"time_info": time_info, "graph_info": graph_info}]})
+    with open("report.csv") as csvfile:
+        header, row = list(csv.reader(csvfile))[1:3]
+    assert row[header.index("comparisons")] == "NA"
+    assert row[header.index("inserts")] == "6"
@@ -1,5 +1,6 @@
 import pytest
 from heaps import minheap
+from heaps.base import Heap
 
 # Set up an empty MinHeap for test functions
 @pytest.fixture
@@ -52,3 +53,50 @@ def test_decrease_key_greater(uut):
     x = uut.insert({"key": 5})
     with pytest.raises(ValueError):
         uut.decrease_key(x, 10)
+
+
+def test_heaps_are_independent(uut):
+    other = minheap.MinHeap()
+    uut.insert({"key": 1})
+    assert len(other) == 0
+
+
+def test_decrease_key_tracks_position(uut):
+    nodes = [uut.insert({"key": k}) for k in range(10, 0, -1)]
+    uut.decrease_key(nodes[0], 0)
+    assert nodes[0].pos == 0
+    assert all(uut.heap[node.pos] is node for node in nodes)
+    assert [uut.extract_min().key for _ in range(10)] == list(range(10))
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = minheap.MinHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
+
+
+def test_base_meld_keeps_data(uut):
+    other = minheap.MinHeap()
+    b = other.insert({"key": 7, "value": "pears"}, "b")
+    other.decrease_key(b, 4)
+    Heap.meld(uut, other)
+    node = uut.extract_min()
+    assert node.data == {"key": 4, "value": "pears"}
+    assert node.name == "b"
@@ -61,4 +61,52 @@ def test_decrease_key(uut):
 def test_decrease_key_greater(uut):
     x = uut.insert({"key": 5})
     with pytest.raises(ValueError):
-        uut.decrease_key(x, 10)
\ No newline at end of file
+        uut.decrease_key(x, 10)
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_extract_min_empty(uut):
+    with pytest.raises(ValueError):
+        uut.extract_min()
+
+
+def test_one_tree_per_height_after_extract(uut):
+    for k in range(33):
+        uut.insert({"key": k})
+    uut.extract_min()
+    assert all(len(level) <= 1 for level in uut.trees)
+    assert uut.find_min().key == 1
+
+
+def test_sorted_order_with_decreases(uut):
+    nodes = [uut.insert({"key": (7 * k) % 101}, k) for k in range(101)]
+    out = [uut.extract_min().key for _ in range(20)]
+    for node in nodes[::3]:
+        if node.highestclone is not None:
+            uut.decrease_key(node, node.key - 50)
+    out += [uut.extract_min().key for _ in range(len(uut))]
+    assert out[:20] == sorted(out[:20])
+    assert out[20:] == sorted(out[20:])
+    assert len(out) == 101
+    assert sum(uut.numv) == 0
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = quake.QuakeHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
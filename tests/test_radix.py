@@ -0,0 +1,118 @@
+""" Radix Heap Unit Tests"""
+
+import pytest
+from heaps.radix import RadixHeap
+
+
+# Empty Radix Heap for test functions
+@pytest.fixture
+def uut():
+    return RadixHeap()
+
+
+def test_insert(uut):
+    node = {"key": 5, "value": "apples"}
+    test_node = uut.insert(node, node["value"])
+    assert test_node.key == 5
+    assert test_node.name == "apples"
+
+
+def test_insert_count(uut):
+    uut.insert({"key": 8})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 4})
+    assert len(uut) == 4
+
+
+def test_find_min(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()  # Extract 4
+    uut.extract_min()  # Extract 5
+    assert uut.find_min().key == 7
+
+
+def test_extract_min(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    uut.insert({"key": 7})
+    uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    assert uut.extract_min().key == 4
+    assert uut.extract_min().key == 5
+
+
+def test_decrease_key(uut):
+    uut.insert({"key": 5})
+    uut.insert({"key": 4})
+    x = uut.insert({"key": 100})
+    y = uut.insert({"key": 9})
+    uut.insert({"key": 67})
+    uut.extract_min()
+    uut.decrease_key(x, 4)
+    assert uut.extract_min().key == 4  # extract x
+    uut.decrease_key(y, 8)
+    assert y.key == 8
+
+
+def test_decrease_key_greater(uut):
+    x = uut.insert({"key": 5})
+    with pytest.raises(ValueError):
+        uut.decrease_key(x, 10)
+
+
+def test_decrease_key_below_last(uut):
+    uut.insert({"key": 5})
+    x = uut.insert({"key": 9})
+    uut.extract_min()
+    with pytest.raises(ValueError):
+        uut.decrease_key(x, 4)
+
+
+def test_infinite_keys(uut):
+    x = uut.insert({"key": float("inf")})
+    uut.insert({"key": float("inf")})
+    uut.insert({"key": 3})
+    assert uut.extract_min().key == 3
+    uut.decrease_key(x, 2000)
+    assert uut.extract_min() is x
+    assert uut.extract_min().key == float("inf")
+    assert len(uut) == 0
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = RadixHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
+
+
+def test_meld_lower_last(uut):
+    uut.insert({"key": 10}, "a")
+    uut.insert({"key": 20}, "b")
+    uut.extract_min()  # last is now 10
+    other = RadixHeap()
+    other.insert({"key": 4}, "c")
+    uut.meld(other)
+    assert uut.last == 0
+    assert [uut.extract_min().name for _ in range(2)] == ["c", "b"]
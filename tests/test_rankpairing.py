@@ -4,10 +4,10 @@ import pytest
 from heaps.rankpairing import RankPairingHeap
 
 
-# Empty RankPairing Heap for test functions
-@pytest.fixture
-def uut():
-    return RankPairingHeap()
+# Empty type-1 and type-2 RankPairing Heaps for test functions
+@pytest.fixture(params=[1, 2], ids=["type1", "type2"])
+def uut(request):
+    return RankPairingHeap(rank_type=request.param)
 
 
 def test_insert(uut):
@@ -63,3 +63,50 @@ def test_decrease_key_greater(uut):
     x = uut.insert({"key": 5})
     with pytest.raises(ValueError):
         uut.decrease_key(x, 10)
+
+
+def test_rank_type_invalid():
+    with pytest.raises(ValueError):
+        RankPairingHeap(rank_type=3)
+
+
+def test_decrease_key_deep_node(uut):
+    nodes = [uut.insert({"key": k}) for k in range(20, 0, -1)]
+    uut.extract_min()  # Links the remaining roots into half-trees
+    uut.decrease_key(nodes[0], 0)
+    assert uut.find_min() is nodes[0]
+    keys = [uut.extract_min().key for _ in range(len(uut))]
+    assert keys == [0] + list(range(2, 20))
+
+
+def test_merge(uut):
+    other = RankPairingHeap(uut.rank_type)
+    uut.insert({"key": 5})
+    other.insert({"key": 3})
+    other.insert({"key": 8})
+    uut.merge(other)
+    assert uut.count == 3
+    assert [uut.extract_min().key for _ in range(3)] == [3, 5, 8]
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = RankPairingHeap(uut.rank_type)
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]
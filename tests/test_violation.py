@@ -63,3 +63,55 @@ def test_decrease_key_greater(uut):
     x = uut.insert({"key": 5})
     with pytest.raises(ValueError):
         uut.decrease_key(x, 10)
+
+
+def test_insert_many(uut):
+    uut.insert({"key": 6})
+    keys = [9, 3, 7, 1, 8, 4]
+    nodes = uut.insert_many(({"key": k}, k) for k in keys)
+    assert [node.name for node in nodes] == keys
+    assert len(uut) == 7
+    uut.decrease_key(nodes[0], 2)
+    assert [uut.extract_min().key for _ in range(7)] == [1, 2, 3, 4, 6, 7, 8]
+
+
+def test_extract_min_empty(uut):
+    with pytest.raises(ValueError):
+        uut.extract_min()
+
+
+def test_decrease_key_non_root(uut):
+    nodes = [uut.insert({"key": k}, k) for k in range(10)]
+    uut.extract_min()  # 3-way joins leave 1..9 in trees
+    assert all(node is None for node in uut.rank_table)
+    children = [node for node in nodes[1:] if node.parent is not None]
+    assert children
+    for node in children:
+        uut.decrease_key(node, node.key - 20)
+        assert node.parent is None or uut._active(node)
+    out = [uut.extract_min().key for _ in range(len(uut))]
+    assert out == sorted(out)
+    assert len(out) == 9
+
+
+def test_active_decrease_in_order_stays(uut):
+    nodes = [uut.insert({"key": 10 * k}, k) for k in range(4)]
+    uut.extract_min()  # 10 becomes the parent of 20 and 30
+    child = nodes[3]
+    assert uut._active(child) and child.parent is nodes[1]
+    uut.decrease_key(child, 15)
+    assert child.parent is nodes[1]
+    assert [uut.extract_min().key for _ in range(3)] == [10, 15, 20]
+
+
+def test_meld(uut):
+    a = uut.insert({"key": 5}, "a")
+    other = ViolationHeap()
+    b = other.insert({"key": 7}, "b")
+    other.insert({"key": 9}, "c")
+    uut.meld(other)
+    assert len(uut) == 3
+    assert len(other) == 0
+    uut.decrease_key(b, 4)
+    uut.decrease_key(a, 3)
+    assert [uut.extract_min().name for _ in range(3)] == ["a", "b", "c"]